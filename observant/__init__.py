@@ -1,5 +1,5 @@
 from .interfaces import IObservable, IObservableDict, IObservableList, IObservableProxy
-from .observable import Observable
+from .observable import Observable, batch
 from .observable_dict import ObservableDict
 from .observable_list import ObservableList
 from .observable_proxy import ObservableProxy
@@ -19,4 +19,5 @@ __all__ = [
     "IObservableProxy",
     "IObservable",
     "UndoableObservable",
+    "batch",
 ]
@@ -10,6 +10,8 @@ TValue = TypeVar("TValue")
 class IObservableDict(Generic[TKey, TValue], ABC):
     """Interface for observable dictionaries with specific event types."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __len__(self) -> int:
         """Return the number of items in the dictionary."""
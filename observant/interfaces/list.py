@@ -9,6 +9,8 @@ T = TypeVar("T")
 class IObservableList(Generic[T], ABC):
     """Interface for observable lists with specific event types."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __len__(self) -> int:
         """Return the number of items in the list."""
@@ -1,9 +1,12 @@
+from collections.abc import Awaitable
 from typing import Callable, Generic, TypeVar
 
 T = TypeVar("T")
 
 
 class IObservable(Generic[T]):
+    __slots__ = ()
+
     def get(self) -> T:
         """
         Get the current value of the observable.
@@ -13,22 +16,44 @@ class IObservable(Generic[T]):
         """
         ...
 
-    def set(self, value: T, notify: bool = True) -> None:
+    def set(self, value: T, notify: bool = True, *, force: bool = False) -> None:
         """
         Set a new value for the observable and notify all registered callbacks.
 
         Args:
             value: The new value to set.
             notify: Whether to notify the callbacks after setting the value.
+            force: Whether to notify even if the value equals the current one, for
+                   observables that skip equal values (such as proxy scalar fields).
         """
         ...
 
-    def on_change(self, callback: Callable[[T], None]) -> None:
+    def on_change(self, callback: Callable[[T], None], *, weak: bool = False) -> None:
         """
         Register a callback function to be called when the value changes.
 
         Args:
             callback: A function that takes the new value as its argument.
+            weak: Whether to hold the callback through a weak reference, so it is
+                  dropped once nothing else references it.
+        """
+        ...
+
+    async def set_async(self, value: T) -> None:
+        """
+        Set a new value and wait for all async callbacks to finish.
+
+        Args:
+            value: The new value to set.
+        """
+        ...
+
+    def on_change_async(self, callback: Callable[[T], Awaitable[None]]) -> None:
+        """
+        Register a coroutine function to be run when the value changes.
+
+        Args:
+            callback: A coroutine function that takes the new value as its argument.
         """
         ...
 
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
 from typing import Any, Callable, Generic, TypeVar
 
 from observant.interfaces.dict import IObservableDict
@@ -16,6 +17,8 @@ class IObservableProxy(Generic[T], ABC):
     Provides optional sync behavior to automatically write back to the source model.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def observable(
         self,
@@ -76,6 +79,16 @@ class IObservableProxy(Generic[T], ABC):
         """
         ...
 
+    @abstractmethod
+    def batch(self) -> AbstractContextManager[None]:
+        """
+        Group several changes so that listeners and validators run once, at the end.
+
+        Returns:
+            A context manager; notifications and validation are flushed when it exits.
+        """
+        ...
+
     @abstractmethod
     def save_to(self, obj: T) -> None:
         """
@@ -151,6 +164,9 @@ class IObservableProxy(Generic[T], ABC):
         self,
         attr: str,
         validator: Callable[[Any], str | None],
+        *,
+        key: Callable[[Any], Any] | None = None,
+        cache: bool = False,
     ) -> None:
         """
         Add a validator function for a field.
@@ -159,6 +175,10 @@ class IObservableProxy(Generic[T], ABC):
             attr: The field name to validate.
             validator: A function that takes the field value and returns an error message
                        if invalid, or None if valid.
+            key: Optional function deriving a key from the value. If given, the validator
+                 is only re-run when the key changes.
+            cache: Whether results may be cached per value. Only correct for validators
+                   that depend on nothing but the value.
         """
         ...
 
@@ -198,6 +218,18 @@ class IObservableProxy(Generic[T], ABC):
         """
         ...
 
+    @abstractmethod
+    def validation_snapshot(self) -> tuple[bool, dict[str, list[str]], dict[str, list[str]]]:
+        """
+        Get the complete validation state in a single call.
+
+        Returns:
+            A tuple of (is_valid, errors, errors_by_field) where errors is a plain
+            copy of validation_errors() and errors_by_field holds a copy of each
+            field's error list.
+        """
+        ...
+
     @abstractmethod
     def reset_validation(self, attr: str | None = None, *, revalidate: bool = False) -> None:
         """
@@ -1,10 +1,192 @@
-from typing import Callable, Generic, TypeVar, override
+import asyncio
+import warnings
+import weakref
+from collections.abc import Awaitable, Generator, Hashable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MethodType
+from typing import Any, Callable, Generic, TypeVar, override
 
 from observant.interfaces.observable import IObservable
 
 T = TypeVar("T")
 
 
+class _Batch:
+    """
+    State of one outermost batch() block.
+
+    Asyncio tasks copy the context they are created in, so a task started inside the
+    block can still see this batch after it has closed. The closed flag tells set() to
+    notify immediately in that case.
+
+    Attributes:
+        pending: Observables set during the batch, in first-set order (values are unused).
+        closed: Whether the batch() block has exited.
+    """
+
+    __slots__ = ("pending", "closed")
+
+    def __init__(self) -> None:
+        self.pending: dict[Observable[Any], None] = {}
+        self.closed = False
+
+
+# Tags the identity-based key of an unhashable callback, so it never equals a callback itself
+_UNHASHABLE_CALLBACK = object()
+
+# The batch() opened by the current thread or asyncio task, or None
+_current_batch: "ContextVar[_Batch | None]" = ContextVar("observant_current_batch", default=None)
+
+# Strong references to scheduled async callbacks, so they are not garbage collected mid-flight
+_running_tasks: "set[asyncio.Future[None]]" = set()
+
+
+@contextmanager
+def batch() -> Generator[None, None, None]:
+    """
+    Defer Observable notifications until the end of the block.
+
+    Inside the block, set() still updates values immediately, but callbacks are not
+    called. When the outermost block exits, each observable that was set is notified
+    once with its final value, in the order the observables were first set. A callback
+    registered on several of those observables is called only once, with the value of
+    the last one. Nested batch() blocks join the outermost one.
+
+    A batch only covers the thread or asyncio task that opened it; sets made from other
+    threads or tasks notify immediately, as usual.
+
+    Examples:
+        ```python
+        counter = Observable[int](0)
+        counter.on_change(lambda value: print(f"Counter changed to {value}"))
+
+        with batch():
+            counter.set(1)
+            counter.set(2)
+            counter.set(3)
+        # Prints once: "Counter changed to 3"
+        ```
+    """
+    current = _current_batch.get()
+    if current is not None and not current.closed:
+        # Nested: the outermost block flushes
+        yield
+        return
+
+    current = _Batch()
+    token = _current_batch.set(current)
+    try:
+        yield
+    finally:
+        # Closed before flushing, so sets made by callbacks notify immediately
+        current.closed = True
+        _current_batch.reset(token)
+        _flush_pending(current.pending)
+
+
+def _flush_pending(pending: "dict[Observable[Any], None]") -> None:
+    """
+    Notify every observable set during the batch with its final value.
+
+    A callback registered on several of these observables is called only once, in the
+    position of its first registration, with the value of the last observable it is on.
+
+    Args:
+        pending: The observables set during the batch, in first-set order.
+
+    Raises:
+        Exception: The first exception raised by a callback, re-raised once every
+            other callback has been called.
+    """
+    # Re-assigning an existing key keeps its position but replaces the value
+    to_fire: dict[Hashable, tuple[Callable[[Any], None], Any]] = {}
+    for observable in pending:
+        if not observable._on_change_enabled:  # pyright: ignore[reportPrivateUsage]
+            continue
+        value = observable._value  # pyright: ignore[reportPrivateUsage]
+        for callback in observable._callbacks:  # pyright: ignore[reportPrivateUsage]
+            to_fire[_callback_key(callback)] = (callback, value)
+
+    # A raising callback must not cost the other listeners their notification, so the
+    # first error is held until everything has been delivered
+    first_error: Exception | None = None
+    for callback, value in to_fire.values():
+        try:
+            callback(value)
+        except Exception as e:
+            if first_error is None:
+                first_error = e
+
+    for observable in pending:
+        if observable._async_callbacks and observable._on_change_enabled:  # pyright: ignore[reportPrivateUsage]
+            observable._schedule_async(observable._value)  # pyright: ignore[reportPrivateUsage]
+
+    if first_error is not None:
+        raise first_error
+
+
+def _callback_key(callback: Callable[[Any], None]) -> Hashable:
+    """
+    Get the key used to recognize the same callback on several observables in a batch.
+
+    Equal callbacks (such as two bound methods of the same instance) share a key, and weak
+    registrations are keyed by the callback they wrap, so a weak listener on several
+    observables is recognized too. Callbacks that cannot be hashed, including bound methods
+    of unhashable instances, fall back to their identity.
+
+    Args:
+        callback: A registered on_change callback.
+
+    Returns:
+        The callback itself, or a key derived from its id() if it is unhashable.
+    """
+    if isinstance(callback, _WeakCallback):
+        # A dead target is skipped by the wrapper anyway; key it by the wrapper itself
+        callback = callback.target() or callback
+    try:
+        hash(callback)
+    except TypeError:
+        return (_UNHASHABLE_CALLBACK, id(callback))
+    return callback
+
+
+class _WeakCallback:
+    """
+    Calls an on_change callback through a weak reference.
+
+    Bound methods are held with a WeakMethod, so the callback does not keep its instance
+    alive. Once the target is garbage collected, the wrapper removes itself from the
+    observable's callbacks, so dead listeners are never iterated.
+    """
+
+    __slots__ = ("_ref",)
+
+    _ref: "weakref.ref[Callable[[Any], None]]"
+
+    def __init__(self, callback: Callable[[Any], None], observable: "Observable[Any]") -> None:
+        observable_ref = weakref.ref(observable)
+
+        def remove(_: object) -> None:
+            target = observable_ref()
+            if target is not None:
+                target._callbacks = tuple(c for c in target._callbacks if c is not self)  # pyright: ignore[reportPrivateUsage]
+
+        if isinstance(callback, MethodType):
+            self._ref = weakref.WeakMethod(callback, remove)
+        else:
+            self._ref = weakref.ref(callback, remove)
+
+    def target(self) -> Callable[[Any], None] | None:
+        """Return the wrapped callback, or None if it has been garbage collected."""
+        return self._ref()
+
+    def __call__(self, value: Any) -> None:
+        callback = self._ref()
+        if callback is not None:
+            callback(value)
+
+
 class Observable(Generic[T], IObservable[T]):
     """
     A generic observable value that notifies listeners when its value changes.
@@ -14,8 +196,11 @@ class Observable(Generic[T], IObservable[T]):
 
     Attributes:
         _value: The current value of the observable.
-        _callbacks: List of callback functions to be called when the value changes.
+        _callbacks: Tuple of callback functions to be called when the value changes.
+        _async_callbacks: Tuple of coroutine functions to be scheduled when the value changes.
+        _collected_async_tasks: Tasks scheduled while set_async() runs, which it then awaits; otherwise None.
         _on_change_enabled: Whether callbacks are enabled.
+        _warned_no_loop: Whether the missing event loop warning has already been emitted.
 
     Examples:
         ```python
@@ -33,9 +218,14 @@ class Observable(Generic[T], IObservable[T]):
         ```
     """
 
+    __slots__ = ("_value", "_callbacks", "_async_callbacks", "_collected_async_tasks", "_on_change_enabled", "_warned_no_loop", "__weakref__")  # pyright: ignore[reportUninitializedInstanceVariable]
+
     _value: T
-    _callbacks: list[Callable[[T], None]]
-    _on_change_enabled: bool = True
+    _callbacks: tuple[Callable[[T], None], ...]
+    _async_callbacks: tuple[Callable[[T], Awaitable[None]], ...]
+    _collected_async_tasks: "list[asyncio.Future[None]] | None"
+    _on_change_enabled: bool
+    _warned_no_loop: bool
 
     def __init__(self, value: T, *, on_change: Callable[[T], None] | None = None, on_change_enabled: bool = True) -> None:
         """
@@ -47,8 +237,11 @@ class Observable(Generic[T], IObservable[T]):
             on_change_enabled: Whether callbacks should be enabled initially.
         """
         self._value = value
-        self._callbacks = []
+        self._callbacks = ()
+        self._async_callbacks = ()
+        self._collected_async_tasks = None
         self._on_change_enabled = on_change_enabled
+        self._warned_no_loop = False
 
     @override
     def get(self) -> T:
@@ -67,7 +260,7 @@ class Observable(Generic[T], IObservable[T]):
         return self._value
 
     @override
-    def set(self, value: T, notify: bool = True) -> None:
+    def set(self, value: T, notify: bool = True, *, force: bool = False) -> None:
         """
         Set a new value for the observable and notify all registered callbacks.
 
@@ -77,6 +270,8 @@ class Observable(Generic[T], IObservable[T]):
         Args:
             value: The new value to set.
             notify: Whether to notify the callbacks after setting the value.
+            force: Accepted for interface compatibility. A plain Observable notifies
+                   even for equal values, so it has no effect here.
 
         Examples:
             ```python
@@ -95,11 +290,79 @@ class Observable(Generic[T], IObservable[T]):
         if not notify or not self._on_change_enabled:
             return
 
+        current = _current_batch.get()
+        if current is not None and not current.closed:
+            # Notified once with the final value when the batch ends
+            current.pending[self] = None
+            return
+
         for callback in self._callbacks:
             callback(value)
 
+        if self._async_callbacks:
+            self._schedule_async(value)
+
+    @override
+    async def set_async(self, value: T) -> None:
+        """
+        Set a new value, then wait for all async callbacks to finish.
+
+        Behaves like set(), including calling the regular callbacks before returning
+        control, but also awaits the coroutines registered with on_change_async()
+        for this change. Must be called from a running event loop.
+
+        Args:
+            value: The new value to set.
+
+        Examples:
+            ```python
+            async def save(value: str) -> None:
+                await storage.write("name", value)
+
+            name = Observable[str]("Alice")
+            name.on_change_async(save)
+
+            await name.set_async("Bob")  # Returns once save("Bob") has completed
+            ```
+        """
+        tasks: list[asyncio.Future[None]] = []
+        self._collected_async_tasks = tasks
+        try:
+            self.set(value)
+        finally:
+            self._collected_async_tasks = None
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    def _schedule_async(self, value: T) -> None:
+        """
+        Schedule the async callbacks for a value on the running event loop.
+
+        Without a running loop the callbacks are skipped. A warning is emitted the first
+        time this happens for the observable.
+
+        Args:
+            value: The value to pass to the callbacks.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if self._warned_no_loop:
+                return
+            self._warned_no_loop = True
+            warnings.warn("Observable has async callbacks but no event loop is running; they were not called", RuntimeWarning, stacklevel=3)
+            return
+
+        for callback in self._async_callbacks:
+            task = asyncio.ensure_future(callback(value))
+            _running_tasks.add(task)
+            task.add_done_callback(_running_tasks.discard)
+            if self._collected_async_tasks is not None:
+                self._collected_async_tasks.append(task)
+
     @override
-    def on_change(self, callback: Callable[[T], None]) -> None:
+    def on_change(self, callback: Callable[[T], None], *, weak: bool = False) -> None:
         """
         Register a callback function to be called when the value changes.
 
@@ -108,10 +371,14 @@ class Observable(Generic[T], IObservable[T]):
         order they were registered.
 
         If the same callback function is registered multiple times, it will only
-        be added once.
+        be added once, whether it was registered weakly or not; the first registration
+        is kept.
 
         Args:
             callback: A function that takes the new value as its argument.
+            weak: Whether to hold the callback through a weak reference. Bound methods then
+                  do not keep their instance alive, and the callback is removed automatically
+                  once it is garbage collected. The callback must support weak references.
 
         Examples:
             ```python
@@ -128,14 +395,54 @@ class Observable(Generic[T], IObservable[T]):
             # Prints:
             # "Counter changed to 1"
             # "Counter is now 1"
+
+            # Register a bound method without keeping the widget alive
+            counter.on_change(widget.refresh, weak=True)
             ```
         """
-        # Check if this callback is already registered to avoid duplicates
-        for existing_cb in self._callbacks:
-            if existing_cb == callback:
+        # Check if this callback is already registered, weakly or not, to avoid duplicates
+        for existing in self._callbacks:
+            if (existing.target() if isinstance(existing, _WeakCallback) else existing) == callback:
                 return
 
-        self._callbacks.append(callback)
+        if weak:
+            callback = _WeakCallback(callback, self)
+
+        # Rebuilt rather than appended: callbacks are registered rarely but iterated on every
+        # set(), and a callback registered during notification only sees the next change
+        self._callbacks = (*self._callbacks, callback)
+
+    @override
+    def on_change_async(self, callback: Callable[[T], Awaitable[None]]) -> None:
+        """
+        Register a coroutine function to be run when the value changes.
+
+        On every notifying change, each async callback is scheduled as a task on the
+        running event loop, after the regular callbacks have run. set() does not wait
+        for them; set_async() does. If no event loop is running, async callbacks are
+        skipped with a RuntimeWarning.
+
+        If the same callback function is registered multiple times, it will only
+        be added once.
+
+        Args:
+            callback: A coroutine function that takes the new value as its argument.
+
+        Examples:
+            ```python
+            async def save(value: str) -> None:
+                await storage.write("name", value)
+
+            name = Observable[str]("Alice")
+            name.on_change_async(save)
+
+            await name.set_async("Bob")  # Runs save("Bob") and waits for it
+            ```
+        """
+        if callback in self._async_callbacks:
+            return
+
+        self._async_callbacks = (*self._async_callbacks, callback)
 
     @override
     def enable(self) -> None:
@@ -46,6 +46,8 @@ class ObservableDict(Generic[TKey, TValue], IObservableDict[TKey, TValue]):
         ```
     """
 
+    __slots__ = ("_items", "_change_callbacks", "_add_callbacks", "_remove_callbacks", "_update_callbacks", "_clear_callbacks", "__weakref__")
+
     def __init__(self, items: dict[TKey, TValue] | None = None, *, copy: bool = False) -> None:
         """
         Initialize with optional external dict reference.
@@ -44,6 +44,8 @@ class ObservableList(Generic[T], IObservableList[T]):
         ```
     """
 
+    __slots__ = ("_items", "_change_callbacks", "_add_callbacks", "_remove_callbacks", "_clear_callbacks", "__weakref__")
+
     def __init__(self, items: list[T] | None = None, *, copy: bool = False):
         """
         Initialize with optional external list reference.
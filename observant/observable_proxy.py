@@ -1,11 +1,17 @@
+import sys
 import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Generator, Hashable
+from contextlib import contextmanager
+from functools import partial
+from operator import attrgetter
 from typing import Any, Callable, Generic, TypeVar, cast, override
 
-from observant.interfaces.dict import IObservableDict
+from observant.interfaces.dict import IObservableDict, ObservableDictChange
 from observant.interfaces.list import IObservableList
 from observant.interfaces.observable import IObservable
 from observant.interfaces.proxy import IObservableProxy
-from observant.observable import Observable
+from observant.observable import Observable, batch
 from observant.observable_dict import ObservableDict
 from observant.observable_list import ObservableList
 from observant.types.collection_change_type import ObservableCollectionChangeType
@@ -18,6 +24,47 @@ TValue = TypeVar("TValue")
 TDictKey = TypeVar("TDictKey")
 TDictValue = TypeVar("TDictValue")
 
+# Maximum number of cached validation results kept per field
+_VALIDATION_CACHE_SIZE = 256
+
+# Immutable value types whose validation results can safely be cached
+_CACHEABLE_VALUE_TYPES: frozenset[type[Any]] = frozenset({str, int, float, bool, bytes, complex, type(None)})
+
+# Marker for a missing value: a _KeyedValidator that has not run yet, or a field never validated
+_NO_KEY = object()
+
+
+class _KeyedValidator:
+    """
+    Validator wrapper that only re-runs the validator when a key derived from the value changes.
+    Used by ObservableProxy.add_validator(..., key=...).
+    """
+
+    __slots__ = ("_validator", "_key", "_last_key", "_last_result", "_last_error")
+
+    def __init__(self, validator: Callable[[Any], str | None], key: Callable[[Any], Any]) -> None:
+        self._validator = validator
+        self._key = key
+        self._last_key: Any = _NO_KEY
+        self._last_result: str | None = None
+        self._last_error: Exception | None = None
+
+    def __call__(self, value: Any) -> str | None:
+        key = self._key(value)
+        if self._last_key is _NO_KEY or key != self._last_key:
+            try:
+                self._last_result = self._validator(value)
+                self._last_error = None
+            except Exception as e:
+                self._last_result = None
+                self._last_error = e
+            self._last_key = key
+
+        if self._last_error is not None:
+            # Re-raise so the proxy reports it exactly like a fresh failure
+            raise self._last_error.with_traceback(None)
+        return self._last_result
+
 
 class _PathObservable(IObservable[Any]):
     """
@@ -25,6 +72,8 @@ class _PathObservable(IObservable[Any]):
     Provides two-way binding through the path.
     """
 
+    __slots__ = ("_inner", "_proxy", "_segments")
+
     def __init__(
         self,
         inner: Observable[Any],
@@ -38,20 +87,34 @@ class _PathObservable(IObservable[Any]):
     def get(self) -> Any:
         return self._inner.get()
 
-    def set(self, value: Any, notify: bool = True) -> None:
-        # Try to set the value at the path
+    @override
+    def set(self, value: Any, notify: bool = True, *, force: bool = False) -> None:
+        if self._write_path(value):
+            self._inner.set(value, notify, force=force)
+
+    def _write_path(self, value: Any) -> bool:
+        # Try to set the value at the path; returns False if the path is broken
         current_obj: Any = self._proxy._obj
         for part, _ in self._segments[:-1]:
             if current_obj is None:
-                return  # Can't set - path is broken
+                return False  # Can't set - path is broken
             current_obj = getattr(current_obj, part, None)
         if current_obj is None:
-            return  # Can't set - path is broken
+            return False  # Can't set - path is broken
         setattr(current_obj, self._segments[-1][0], value)
-        self._inner.set(value, notify)
+        return True
+
+    def on_change(self, callback: Callable[[Any], None], *, weak: bool = False) -> None:
+        self._inner.on_change(callback, weak=weak)
 
-    def on_change(self, callback: Callable[[Any], None]) -> None:
-        self._inner.on_change(callback)
+    @override
+    async def set_async(self, value: Any) -> None:
+        if self._write_path(value):
+            await self._inner.set_async(value)
+
+    @override
+    def on_change_async(self, callback: Callable[[Any], Awaitable[None]]) -> None:
+        self._inner.on_change_async(callback)
 
     def enable(self) -> None:
         self._inner.enable()
@@ -88,12 +151,19 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
         _scalars: Dictionary of scalar observables.
         _lists: Dictionary of list observables.
         _dicts: Dictionary of dictionary observables.
+        _synced_containers: The model's own list or dict wrapped by each synced collection observable.
         _computeds: Dictionary of computed observables.
         _dirty_fields: Set of field names that have been modified.
-        _validators: Dictionary of validator functions for each field.
-        _validation_errors_dict: Observable dictionary of validation errors.
+        _validators: Dictionary of validator function tuples for each field.
+        _validation_errors_dict: Observable dictionary of validation errors, created on first use.
         _validation_for_cache: Cache of validation observables for each field.
         _is_valid_obs: Observable indicating whether all fields are valid.
+        _validator_generation: Counter bumped whenever cached validation results become stale.
+        _suppressed_validation: Fields whose validators are skipped while cached errors are restored.
+        _validation_results: Per-field LRU cache of validator results keyed by hashable values.
+        _cached_validation_fields: Fields whose validators were all added with cache=True.
+        _validated_values: The value the stored errors of each cached field were computed for.
+        _batched_validation: Latest value per field awaiting validation while a batch is open, or None.
         _default_undo_config: Default undo configuration.
         _field_undo_configs: Dictionary of undo configurations for each field.
         _undo_stacks: Dictionary of undo stacks for each field.
@@ -137,6 +207,37 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
         ```
     """
 
+    __slots__ = (
+        "_obj",
+        "_sync_default",
+        "_scalars",
+        "_lists",
+        "_dicts",
+        "_synced_containers",
+        "_computeds",
+        "_dirty_fields",
+        "_is_dirty_obs",
+        "_validators",
+        "_validation_errors_dict",
+        "_validation_for_cache",
+        "_is_valid_obs",
+        "_validator_generation",
+        "_suppressed_validation",
+        "_validation_results",
+        "_cached_validation_fields",
+        "_validated_values",
+        "_batched_validation",
+        "_default_undo_config",
+        "_field_undo_configs",
+        "_undo_stacks",
+        "_redo_stacks",
+        "_last_change_times",
+        "_pending_undo_groups",
+        "_initial_values",
+        "_nested_proxies",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         obj: T,
@@ -186,18 +287,25 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
         if sync and undo:
             print("Warning: sync=True with undo=True may cause unexpected model mutations during undo/redo.")
 
-        self._scalars: dict[ProxyFieldKey, Observable[Any]] = {}
+        self._scalars: dict[ProxyFieldKey, UndoableObservable[Any]] = {}
         self._lists: dict[ProxyFieldKey, ObservableList[Any]] = {}
         self._dicts: dict[ProxyFieldKey, ObservableDict[Any, Any]] = {}
+        self._synced_containers: dict[ProxyFieldKey, Any] = {}
         self._computeds: dict[str, Observable[Any]] = {}
         self._dirty_fields: set[str] = set()
         self._is_dirty_obs = Observable[bool](False)
 
         # Validation related fields
-        self._validators: dict[str, list[Callable[[Any], str | None]]] = {}
-        self._validation_errors_dict = ObservableDict[str, list[str]]({})
+        self._validators: dict[str, tuple[Callable[[Any], str | None], ...]] = {}
+        self._validation_errors_dict: ObservableDict[str, list[str]] | None = None
         self._validation_for_cache: dict[str, Observable[list[str]]] = {}
         self._is_valid_obs = Observable[bool](True)
+        self._validator_generation = 0
+        self._suppressed_validation: set[str] = set()
+        self._validation_results: dict[str, OrderedDict[Hashable, tuple[str, ...] | None]] = {}
+        self._cached_validation_fields: set[str] = set()
+        self._validated_values: dict[str, Any] = {}
+        self._batched_validation: dict[str, Any] | None = None
 
         # Undo/redo related fields
         self._default_undo_config = UndoConfig(enabled=undo, undo_max=undo_max, undo_debounce_ms=undo_debounce_ms)
@@ -227,6 +335,10 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
         Creates or returns an existing Observable for a scalar field of the proxied object.
         The Observable allows watching for changes to the field value and modifying it.
 
+        Setting a value equal to the current one is a no-op: sync, dirty tracking and
+        validation do not run. After mutating a value in place, pass it back with
+        set(value, force=True) to run them.
+
         Args:
             typ: The type of the field.
             attr: The field name.
@@ -251,6 +363,11 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
 
             # Set a new value
             name_obs.set("New Name")
+
+            # Re-publish a value that was mutated in place
+            point_obs = proxy.observable(Point, "position")
+            point_obs.get().x = 10
+            point_obs.set(point_obs.get(), force=True)
             ```
         """
         sync = self._sync_default if sync is None else sync
@@ -260,10 +377,16 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
         if undo_max is not None or undo_debounce_ms is not None:
             self.set_undo_config(attr, undo_max=undo_max, undo_debounce_ms=undo_debounce_ms)
 
-        # Get the initial value
-        val = getattr(self._obj, attr)
+        obs = self._scalars.get(key)
+        if obs is None:
+            # The stored key and every per-field dict entry use an interned name, so later
+            # lookups with literal names compare by identity
+            attr = sys.intern(attr)
+            key = ProxyFieldKey(attr, sync)
+
+            # Get the initial value
+            val = getattr(self._obj, attr)
 
-        if key not in self._scalars:
             # Create observable with callbacks disabled to prevent premature tracking
             # obs = Observable(val, on_change_enabled=False)
             obs = UndoableObservable(val, attr, self, on_change_enabled=False)
@@ -272,7 +395,8 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             self._scalars[key] = obs
 
             if sync:
-                obs.on_change(lambda v: setattr(self._obj, attr, v))
+                # A C-level callable: no Python frame per write-through
+                obs.on_change(partial(setattr, self._obj, attr))
             # Register dirty tracking callback
             obs.on_change(lambda _, a=attr: self._mark_field_dirty(a))
             # Register validation callback
@@ -283,11 +407,8 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
 
             # Now enable callbacks for future changes
             obs.enable()
-        else:
-            # Get the existing observable
-            obs = self._scalars[key]
 
-        return self._scalars[key]
+        return obs
 
     @override
     def observable_list(
@@ -337,21 +458,26 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
         if undo_max is not None or undo_debounce_ms is not None:
             self.set_undo_config(attr, undo_max=undo_max, undo_debounce_ms=undo_debounce_ms)
 
-        if key not in self._lists:
+        obs = self._lists.get(key)
+        if obs is None:
+            attr = sys.intern(attr)
+            key = ProxyFieldKey(attr, sync)
             val_raw = getattr(self._obj, attr)
             val: list[T] = cast(list[T], val_raw)
-            obs = ObservableList(val, copy=not sync)
+            obs = ObservableList[Any](val, copy=not sync)
             if sync:
-                obs.on_change(lambda _: setattr(self._obj, attr, obs.copy()))
+                obs.on_change(lambda _: self._sync_collection(attr, val, obs))
+                if val_raw is not None:
+                    self._synced_containers[key] = val
             # Register dirty tracking callback
             obs.on_change(lambda _, a=attr: self._mark_field_dirty(a))
             # Register validation callback
-            obs.on_change(lambda _: self._validate_field(attr, obs.copy()))
+            obs.on_change(lambda _: self._validate_collection(attr, obs))
             # Register undo tracking callback
             obs.on_change(lambda c: self._track_list_change(attr, c))
             self._lists[key] = obs
 
-        return self._lists[key]
+        return obs
 
     @override
     def observable_dict(
@@ -401,21 +527,45 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
         if undo_max is not None or undo_debounce_ms is not None:
             self.set_undo_config(attr, undo_max=undo_max, undo_debounce_ms=undo_debounce_ms)
 
-        if key not in self._dicts:
+        obs = self._dicts.get(key)
+        if obs is None:
+            attr = sys.intern(attr)
+            key = ProxyFieldKey(attr, sync)
             val_raw = getattr(self._obj, attr)
             val: dict[Any, Any] = cast(dict[Any, Any], val_raw)
             obs = ObservableDict(val, copy=not sync)
             if sync:
-                obs.on_change(lambda _: setattr(self._obj, attr, obs.copy()))
+                obs.on_change(lambda _: self._sync_collection(attr, val, obs))
+                if val_raw is not None:
+                    self._synced_containers[key] = val
             # Register dirty tracking callback
             obs.on_change(lambda _, a=attr: self._mark_field_dirty(a))
             # Register validation callback
-            obs.on_change(lambda _: self._validate_field(attr, obs.copy()))
+            obs.on_change(lambda _: self._validate_collection(attr, obs))
             # Register undo tracking callback
             obs.on_change(lambda c: self._track_dict_change(attr, c))
             self._dicts[key] = obs
 
-        return self._dicts[key]
+        return obs
+
+    def _sync_collection(self, attr: str, items: Any, obs: ObservableList[Any] | ObservableDict[Any, Any]) -> None:
+        """
+        Write a synced list or dict field back to the model after a change.
+
+        A synced collection wraps the model's own list or dict without copying, so its
+        changes are already visible through the model. The attribute is only written when
+        it no longer holds that container.
+
+        Args:
+            attr: The field name.
+            items: The list or dict the observable was created around.
+            obs: The observable collection.
+        """
+        if items is None:
+            # The field was None, so the observable owns a container the model has never seen
+            setattr(self._obj, attr, obs.copy())
+        elif getattr(self._obj, attr, None) is not items:
+            setattr(self._obj, attr, items)
 
     @override
     def get(self) -> T:
@@ -431,6 +581,9 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
 
         This is a convenience method for setting multiple scalar values at once.
         It creates observables for any fields that don't already have them.
+        Change callbacks run after all values are set, so listeners never see a
+        partially applied update. As with batch(), a callback registered on several
+        of the updated fields is called only once, with the value of the last of them.
 
         Args:
             **kwargs: Keyword arguments where each key is a field name and each value
@@ -442,8 +595,7 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             proxy.update(name="Alice", age=30, active=True)
             ```
         """
-        for attr, value in kwargs.items():
-            self.observable(object, attr).set(value)
+        self._set_scalars(kwargs)
 
     @override
     def load_dict(self, values: dict[str, Any]) -> None:
@@ -451,7 +603,10 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
         Set multiple scalar observable values from a dict.
 
         This is similar to update(), but takes a dictionary instead of keyword arguments.
-        It creates observables for any fields that don't already have them.
+        It creates observables for any fields that don't already have them, and like
+        update(), notifies listeners only after all values are set. A callback registered
+        on several of the loaded fields is called only once, with the value of the last
+        of them.
 
         Args:
             values: A dictionary where each key is a field name and each value
@@ -464,8 +619,72 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             proxy.load_dict(data)
             ```
         """
-        for attr, value in values.items():
-            self.observable(object, attr).set(value)
+        self._set_scalars(values)
+
+    def _set_scalars(self, values: dict[str, Any]) -> None:
+        """
+        Set several scalar fields as one batch, shared by update() and load_dict().
+
+        Args:
+            values: A dictionary mapping field names to their new values.
+        """
+        observable = self.observable
+        intern = sys.intern
+        with self.batch():
+            for attr, value in values.items():
+                # Keys often come from decoded data; interning makes later field lookups pointer comparisons
+                observable(object, intern(attr)).set(value)
+
+    @override
+    @contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """
+        Group several changes so that listeners and validators run once, at the end.
+
+        Inside the block, values change immediately, but scalar change callbacks
+        (including computed properties and sync write-back) are deferred as with
+        observant.batch(), and each touched field is validated once when the block
+        exits. update() and load_dict() use this internally. Nested blocks join the
+        outermost one.
+
+        Examples:
+            ```python
+            with proxy.batch():
+                proxy.observable(str, "first_name").set("Ada")
+                proxy.observable(str, "last_name").set("Lovelace")
+            # "full_name" is recomputed once, and each field is validated once
+            ```
+        """
+        # batch() here is the module-level observant.batch, not this method
+        with self._batch_validation(), batch():
+            yield
+
+    @contextmanager
+    def _batch_validation(self) -> Generator[None, None, None]:
+        """
+        Defer field validation until the end of the block.
+
+        While the block runs, fields are not validated as they change; only the latest
+        value of each touched field is remembered. On exit each touched field is validated
+        once and the is_valid observable is updated once. Nested batches join the
+        outermost one.
+        """
+        if self._batched_validation is not None:
+            yield
+            return
+
+        self._batched_validation = {}
+        try:
+            yield
+        finally:
+            pending = self._batched_validation
+            self._batched_validation = None
+
+            for attr, value in pending.items():
+                self._update_field_errors(attr, value)
+
+            if pending:
+                self._update_is_valid()
 
     @override
     def save_to(self, obj: T) -> None:
@@ -501,14 +720,18 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             print(new_user.name)  # Prints: "Bob"
             ```
         """
+        # A synced collection that the target still holds already has every change, so
+        # copying it again is wasted work. If the attribute was replaced, write it back
+        synced = self._synced_containers
+
         for key, obs in self._scalars.items():
             setattr(obj, key.attr, obs.get())
-
-        for key, obs in self._lists.items():
-            setattr(obj, key.attr, obs.copy())
-
-        for key, obs in self._dicts.items():
-            setattr(obj, key.attr, obs.copy())
+        for key, list_obs in self._lists.items():
+            if key not in synced or getattr(obj, key.attr, None) is not synced[key]:
+                setattr(obj, key.attr, list_obs.copy())
+        for key, dict_obs in self._dicts.items():
+            if key not in synced or getattr(obj, key.attr, None) is not synced[key]:
+                setattr(obj, key.attr, dict_obs.copy())
 
         # Save computed fields that shadow real fields
         for name, obs in self._computeds.items():
@@ -611,12 +834,33 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             ```
         """
         self._dirty_fields.clear()
-        self._is_dirty_obs.set(False)
+        if self._is_dirty_obs.get():
+            self._is_dirty_obs.set(False)
+
+    @staticmethod
+    def _field_observable(observables: dict[ProxyFieldKey, TValue], attr: str) -> TValue | None:
+        """
+        Find the observable for a field in one of the per-kind maps, whatever its sync setting.
+
+        Args:
+            observables: The map to search (_scalars, _lists or _dicts).
+            attr: The field name.
+
+        Returns:
+            The observable, preferring the synced one, or None if the field has none.
+        """
+        # Two hash lookups instead of scanning every registered key
+        obs = observables.get(ProxyFieldKey(attr, True))
+        if obs is None:
+            obs = observables.get(ProxyFieldKey(attr, False))
+        return obs
 
     def _mark_field_dirty(self, attr: str) -> None:
         """Mark a field as dirty and update the dirty observable."""
         self._dirty_fields.add(attr)
-        self._is_dirty_obs.set(True)
+        # Only the clean-to-dirty transition notifies, not every change to a dirty proxy
+        if not self._is_dirty_obs.get():
+            self._is_dirty_obs.set(True)
 
     @override
     def register_computed(
@@ -659,46 +903,48 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             print(greeting_obs.get())  # Prints: "Hello, Bob!"
             ```
         """
+        name = sys.intern(name)
+
         # Create an observable for the computed property
         initial_value = compute()
         obs = Observable(initial_value)
         self._computeds[name] = obs
 
-        # Register callbacks for each dependency
-        for dep in dependencies:
-            # For scalar dependencies
-            def update_computed(_: Any) -> None:
-                new_value = compute()
-                current = obs.get()
-                if new_value != current:
-                    obs.set(new_value)
+        # The cached value is only recomputed when a dependency changes, so get() never calls compute()
+        def update_computed(_: Any) -> None:
+            new_value = compute()
+            current = obs.get()
+            if new_value is not current and new_value != current:
+                obs.set(new_value)
 
+        # Register the callback for each dependency
+        for dep in dependencies:
             # Try to find the dependency in scalars, lists, or dicts
             for sync in [True, False]:
                 key = ProxyFieldKey(dep, sync)
 
-                if key in self._scalars:
-                    self._scalars[key].on_change(update_computed)
+                scalar = self._scalars.get(key)
+                if scalar is not None:
+                    scalar.on_change(update_computed)
                     break
 
-                if key in self._lists:
-                    self._lists[key].on_change(update_computed)
+                list_obs = self._lists.get(key)
+                if list_obs is not None:
+                    list_obs.on_change(update_computed)
                     break
 
-                if key in self._dicts:
-                    self._dicts[key].on_change(update_computed)
+                dict_obs = self._dicts.get(key)
+                if dict_obs is not None:
+                    dict_obs.on_change(update_computed)
                     break
 
             # Check if the dependency is another computed property
-            if dep in self._computeds:
-                self._computeds[dep].on_change(update_computed)
-
-        # Validate the computed property when it changes
-        def validate_computed(_: Any) -> None:
-            value = compute()
-            self._validate_field(name, value)
+            computed = self._computeds.get(dep)
+            if computed is not None:
+                computed.on_change(update_computed)
 
-        obs.on_change(validate_computed)
+        # Validate the computed property when it changes, using the value it was just set to
+        obs.on_change(lambda value: self._validate_field(name, value))
 
     @override
     def computed(
@@ -716,16 +962,20 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
         Returns:
             An observable containing the computed value.
         """
-        if name not in self._computeds:
+        obs = self._computeds.get(name)
+        if obs is None:
             raise KeyError(f"Computed property '{name}' not found")
 
-        return self._computeds[name]
+        return obs
 
     @override
     def add_validator(
         self,
         attr: str,
         validator: Callable[[Any], str | None],
+        *,
+        key: Callable[[Any], Any] | None = None,
+        cache: bool = False,
     ) -> None:
         """
         Add a validator function for a field.
@@ -734,10 +984,23 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
         Multiple validators can be added for the same field.
         Validation errors are tracked and can be observed.
 
+        By default validators are re-run on every change, so they may read other state,
+        such as another field for a "confirm password" check. The key and cache options
+        skip re-running and are only correct for pure validators, whose result depends on
+        nothing but the value they are given.
+
         Args:
             attr: The field name to validate.
             validator: A function that takes the field value and returns an error message
                        if invalid, or None if valid.
+            key: Optional function that derives a cheap, immutable key from the value
+                 (e.g. len for a list). The validator is only re-run when the key changes,
+                 so it must depend on nothing but the key. None means always re-run.
+            cache: Whether results may be cached per value. If every validator of the field
+                   is added with cache=True, results for immutable scalar values (str, int,
+                   float, ...) are remembered and reused when the same value is validated
+                   again. Undo and redo then also restore the field's errors instead of
+                   re-running its validators. Only use this for pure validators.
 
         Examples:
             ```python
@@ -772,12 +1035,29 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             # Get validation errors for a specific field
             name_errors = proxy.validation_for("name")
             print(name_errors.get())  # Prints: ["Name cannot be empty"]
+
+            # Only re-run a length check when the list length changes
+            proxy.add_validator("tags", lambda tags: "Too many tags" if len(tags) > 5 else None, key=len)
+
+            # Reuse results for values that were already validated
+            proxy.add_validator("zip_code", lambda code: None if is_known_zip(code) else "Unknown ZIP code", cache=True)
             ```
         """
-        if attr not in self._validators:
-            self._validators[attr] = []
+        attr = sys.intern(attr)
+        if key is not None:
+            validator = _KeyedValidator(validator, key)
 
-        self._validators[attr].append(validator)
+        # One validator that reads other state makes the whole field uncacheable
+        if cache and (attr not in self._validators or attr in self._cached_validation_fields):
+            self._cached_validation_fields.add(attr)
+        else:
+            self._cached_validation_fields.discard(attr)
+            self._validated_values.pop(attr, None)
+
+        # Stored as a tuple: validators are iterated on every change but rarely added
+        self._validators[attr] = self._validators.get(attr, ()) + (validator,)
+        self._validator_generation += 1
+        self._validation_results.pop(attr, None)
 
         # Validate the current value if it exists
         self._validate_field_if_exists(attr)
@@ -786,8 +1066,8 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
         """
         Validate a field if it exists in any of the observable collections.
 
-        This method attempts to find the field in scalars, lists, or dicts collections,
-        and if found, validates it. If the field is not found in any observable collection,
+        This method attempts to find the field in scalars, lists, dicts, or computed
+        properties, and if found, validates it. If the field is not found in any observable collection,
         it tries to get the value directly from the proxied object.
 
         Args:
@@ -798,25 +1078,28 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             Users typically don't need to call this method directly.
         """
         # Check in scalars
-        for key in self._scalars:
-            if key.attr == attr:
-                value = self._scalars[key].get()
-                self._validate_field(attr, value)
-                return
+        scalar = self._field_observable(self._scalars, attr)
+        if scalar is not None:
+            self._validate_field(attr, scalar.get())
+            return
 
         # Check in lists
-        for key in self._lists:
-            if key.attr == attr:
-                value = self._lists[key].copy()
-                self._validate_field(attr, value)
-                return
+        list_obs = self._field_observable(self._lists, attr)
+        if list_obs is not None:
+            self._validate_field(attr, list_obs.copy())
+            return
 
         # Check in dicts
-        for key in self._dicts:
-            if key.attr == attr:
-                value = self._dicts[key].copy()
-                self._validate_field(attr, value)
-                return
+        dict_obs = self._field_observable(self._dicts, attr)
+        if dict_obs is not None:
+            self._validate_field(attr, dict_obs.copy())
+            return
+
+        # Check in computed properties
+        computed = self._computeds.get(attr)
+        if computed is not None:
+            self._validate_field(attr, computed.get())
+            return
 
         # If we get here, the field doesn't exist in any observable collection yet
         # Try to get it directly from the object
@@ -827,6 +1110,23 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             # If we can't get the value, we can't validate it yet
             pass
 
+    def _validate_collection(self, attr: str, obs: ObservableList[Any] | ObservableDict[Any, Any]) -> None:
+        """
+        Validate a list or dict field after it changed.
+
+        The collection is only copied for the validators when the field has validators
+        or stale errors to clear, so unvalidated collections are not copied on every change.
+
+        Args:
+            attr: The field name.
+            obs: The observable collection holding the field value.
+        """
+        errors_dict = self._validation_errors_dict
+        if attr not in self._validators and (errors_dict is None or attr not in errors_dict):
+            return
+
+        self._validate_field(attr, obs.copy())
+
     def _validate_field(self, attr: str, value: Any) -> None:
         """
         Validate a field value against all its validators.
@@ -835,29 +1135,187 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             attr: The field name.
             value: The value to validate.
         """
+        if attr in self._suppressed_validation:
+            # Cached errors are being restored for this field
+            return
+
+        if self._batched_validation is not None:
+            # Validated once when the batch ends
+            self._batched_validation[attr] = value
+            return
+
         if attr not in self._validators:
             # No validators for this field, it's always valid
-            if attr in self._validation_errors_dict:
-                del self._validation_errors_dict[attr]
+            errors_dict = self._validation_errors_dict
+            if errors_dict is not None and attr in errors_dict:
+                del errors_dict[attr]
             return
 
-        errors: list[str] = []
+        self._update_field_errors(attr, value)
 
-        for validator in self._validators[attr]:
-            try:
-                result = validator(value)
-                if result is not None:
-                    errors.append(result)
-            except Exception as e:
-                errors.append(f"Validation error: {str(e)}")
+        # Update the is_valid observable
+        self._update_is_valid()
+
+    def _update_is_valid(self) -> None:
+        """Update the is_valid observable, notifying only when validity actually flips."""
+        errors_dict = self._validation_errors_dict
+        is_valid = errors_dict is None or len(errors_dict) == 0
+        if self._is_valid_obs.get() != is_valid:
+            self._is_valid_obs.set(is_valid)
+
+    def _update_field_errors(self, attr: str, value: Any) -> None:
+        """
+        Run a field's validators and store the resulting errors, without updating is_valid.
+
+        Args:
+            attr: The field name.
+            value: The value to validate.
+        """
+        errors = self._run_validators(attr, value) if attr in self._validators else None
+        self._store_field_errors(attr, errors)
+        if attr in self._cached_validation_fields:
+            self._validated_values[attr] = value
+
+    def _errors_dict(self) -> ObservableDict[str, list[str]]:
+        """Get the validation errors dict, creating it on first use."""
+        if self._validation_errors_dict is None:
+            self._validation_errors_dict = ObservableDict[str, list[str]]({})
+        return self._validation_errors_dict
 
+    def _store_field_errors(self, attr: str, errors: list[str] | None) -> None:
+        """
+        Store a field's errors in the validation errors dict, without updating is_valid.
+
+        Args:
+            attr: The field name.
+            errors: The field's error messages. None or an empty list removes the field's entry.
+        """
         if errors:
-            self._validation_errors_dict[attr] = errors
-        elif attr in self._validation_errors_dict:
+            errors_dict = self._errors_dict()
+            # Keep the existing list (and skip the change notification) if nothing changed
+            if errors_dict.get(attr) != errors:
+                errors_dict[attr] = errors
+        elif self._validation_errors_dict is not None and attr in self._validation_errors_dict:
             del self._validation_errors_dict[attr]
 
-        # Update the is_valid observable
-        self._is_valid_obs.set(len(self._validation_errors_dict) == 0)
+    def _run_validators(self, attr: str, value: Any) -> list[str] | None:
+        """
+        Run all validators of a field against a value and collect the error messages.
+
+        If every validator of the field was added with cache=True, results for immutable
+        scalar values (str, int, float, ...) are cached per field and reused when the same
+        value is validated again. Other fields and values, which may be mutated in place,
+        are always validated.
+
+        Args:
+            attr: The field name.
+            value: The value to validate.
+
+        Returns:
+            The list of error messages, or None if the value is valid.
+        """
+        # Include the type so that e.g. 1, 1.0 and True do not share a result
+        value_type = cast(type[Any], type(value))
+        cache_key: Hashable | None = (value_type, value) if value_type in _CACHEABLE_VALUE_TYPES and attr in self._cached_validation_fields else None
+
+        results = self._validation_results.get(attr)
+        if cache_key is not None and results is not None and cache_key in results:
+            results.move_to_end(cache_key)
+            cached = results[cache_key]
+            return list(cached) if cached is not None else None
+
+        validators = self._validators[attr]
+
+        # The list is only allocated once the first error appears; valid values produce None
+        errors: list[str] | None = None
+
+        if len(validators) == 1:
+            # Most fields have a single validator; call it without building a loop
+            try:
+                result = validators[0](value)
+            except Exception as e:
+                errors = [f"Validation error: {e}"]
+            else:
+                if result is not None:
+                    errors = [result]
+        else:
+            for validator in validators:
+                try:
+                    result = validator(value)
+                except Exception as e:
+                    result = f"Validation error: {e}"
+                if result is not None:
+                    if errors is None:
+                        errors = [result]
+                    else:
+                        errors.append(result)
+
+        if cache_key is not None:
+            if errors is not None:
+                # Cached results can outlive many validations; equal messages then share one string
+                errors = [sys.intern(error) if type(error) is str else error for error in errors]
+            if results is None:
+                results = self._validation_results[attr] = OrderedDict()
+            results[cache_key] = tuple(errors) if errors is not None else None
+            if len(results) > _VALIDATION_CACHE_SIZE:
+                results.popitem(last=False)
+
+        return errors
+
+    def _snapshot_field_errors(self, attr: str, value: Any) -> tuple[int, Any, list[str] | None]:
+        """
+        Capture the current validation errors of a field so they can be restored later.
+
+        The errors are only trusted when they are known to belong to the given value:
+        validation must not be deferred by an open batch, every validator of the field
+        must be a cached (pure) one, since others may depend on state that changes before
+        the restore, and the stored errors must have been computed for that very value
+        (set(..., notify=False) changes a value without validating it). Otherwise the
+        snapshot is marked stale and restoring re-runs the validators.
+
+        Args:
+            attr: The field name.
+            value: The field value the errors should belong to.
+
+        Returns:
+            A tuple of (validator generation, value, copy of the field's errors or None if it has none).
+        """
+        if self._batched_validation is not None or attr not in self._cached_validation_fields or self._validated_values.get(attr, _NO_KEY) is not value:
+            # No generation is ever negative, so _restore_with_errors() re-validates
+            return -1, value, None
+
+        errors = self._validation_errors_dict.get(attr) if self._validation_errors_dict is not None else None
+        return self._validator_generation, value, list(errors) if errors is not None else None
+
+    def _restore_with_errors(self, attr: str, action: Callable[[], None], snapshot: tuple[int, Any, list[str] | None]) -> None:
+        """
+        Run an action that restores a field value, then restore the matching validation errors.
+
+        Validators for the field are not run while the action executes. If the snapshot is
+        stale (validators were added, validation was reset, or the errors could not be
+        trusted when it was taken), the validators are run once on the restored value instead.
+
+        Args:
+            attr: The field name.
+            action: The function that restores the field value.
+            snapshot: Errors captured with _snapshot_field_errors() for the value being restored.
+        """
+        generation, value, errors = snapshot
+
+        self._suppressed_validation.add(attr)
+        try:
+            action()
+        finally:
+            self._suppressed_validation.discard(attr)
+
+        if generation != self._validator_generation:
+            # Some restore actions set the value with notify=False, so validate explicitly
+            self._validate_field_if_exists(attr)
+            return
+
+        self._store_field_errors(attr, list(errors) if errors else None)
+        self._validated_values[attr] = value
+        self._update_is_valid()
 
     @override
     def is_valid(self) -> IObservable[bool]:
@@ -927,7 +1385,7 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             print(dict(errors))  # Prints: {'age': ['Age must be positive']}
             ```
         """
-        return self._validation_errors_dict
+        return self._errors_dict()
 
     @override
     def validation_for(self, attr: str) -> IObservable[list[str]]:
@@ -964,22 +1422,62 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             print(name_errors.get())  # Prints: []
             ```
         """
-        if attr not in self._validation_for_cache:
+        obs = self._validation_for_cache.get(attr)
+        if obs is None:
+            attr = sys.intern(attr)
+
             # Create a computed observable that depends on the validation errors dict
-            initial_value = self._validation_errors_dict.get(attr) or []
+            errors_dict = self._errors_dict()
+            initial_value = errors_dict.get(attr) or []
             obs = Observable[list[str]](initial_value)
 
-            # Update the observable when the validation errors dict changes
-            def update_validation(_: Any) -> None:
-                new_value = self._validation_errors_dict.get(attr) or []
+            # Update the observable when this field's entry in the validation errors dict changes
+            def update_validation(change: ObservableDictChange[str, list[str]]) -> None:
+                if change.key is not None and change.key != attr:
+                    # Another field's errors changed (clears have no key and always apply)
+                    return
+
+                new_value = errors_dict.get(attr) or []
                 current = obs.get()
-                if new_value != current:
+                if new_value is not current and new_value != current:
                     obs.set(new_value)
 
-            self._validation_errors_dict.on_change(update_validation)
+            errors_dict.on_change(update_validation)
             self._validation_for_cache[attr] = obs
 
-        return self._validation_for_cache[attr]
+        return obs
+
+    @override
+    def validation_snapshot(self) -> tuple[bool, dict[str, list[str]], dict[str, list[str]]]:
+        """
+        Get the complete validation state in a single call.
+
+        This is a convenience for code that would otherwise call is_valid(),
+        validation_errors() and validation_for() one after another. The returned
+        values are plain copies and do not update when validation changes.
+
+        Returns:
+            A tuple of (is_valid, errors, errors_by_field):
+            - is_valid: True if no field has validation errors.
+            - errors: A plain dict copy of validation_errors().
+            - errors_by_field: A dict mapping each invalid field to a copy of its error list.
+
+        Examples:
+            ```python
+            # Create a proxy with validation
+            user = User(name="", age=30)
+            proxy = ObservableProxy(user)
+            proxy.add_validator("name", lambda name: "Name cannot be empty" if not name else None)
+
+            # Read the whole validation state at once
+            valid, errors, errors_by_field = proxy.validation_snapshot()
+            print(valid)  # Prints: False
+            print(errors_by_field["name"])  # Prints: ['Name cannot be empty']
+            ```
+        """
+        errors = self._validation_errors_dict.copy() if self._validation_errors_dict is not None else {}
+        errors_by_field = {attr: list(messages) for attr, messages in errors.items()}
+        return not errors, errors, errors_by_field
 
     @override
     def reset_validation(self, attr: str | None = None, *, revalidate: bool = False) -> None:
@@ -1022,11 +1520,23 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             print(proxy.validation_for("age").get())   # Prints: ['Age must be positive']
             ```
         """
+        # Errors cached for undo/redo no longer match the validation state
+        self._validator_generation += 1
+
+        # Forget cached validator results so revalidation really re-runs the validators
+        if attr is None:
+            self._validation_results.clear()
+            self._validated_values.clear()
+        else:
+            self._validation_results.pop(attr, None)
+            self._validated_values.pop(attr, None)
+
         if attr is None:
             # Reset all validation errors
-            self._validation_errors_dict.clear()
+            if self._validation_errors_dict is not None:
+                self._validation_errors_dict.clear()
             # Update the is_valid observable
-            self._is_valid_obs.set(True)
+            self._update_is_valid()
 
             # Re-run all validators if requested
             if revalidate:
@@ -1034,10 +1544,10 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
                     self._validate_field_if_exists(field_name)
         else:
             # Reset validation errors for a specific field
-            if attr in self._validation_errors_dict:
+            if self._validation_errors_dict is not None and attr in self._validation_errors_dict:
                 del self._validation_errors_dict[attr]
                 # Update the is_valid observable
-                self._is_valid_obs.set(len(self._validation_errors_dict) == 0)
+                self._update_is_valid()
 
             # Re-run validator for this field if requested
             if revalidate:
@@ -1121,9 +1631,7 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
 
         # If undo_max is None, use the default from UndoConfig
         if config.undo_max is None:
-            from observant.types.undo_config import UndoConfig as DefaultUndoConfig
-
-            config.undo_max = DefaultUndoConfig.undo_max
+            config.undo_max = UndoConfig.undo_max
 
         # Make sure the enabled flag is set correctly
         # If this is a field-specific config, check if it has an explicit enabled flag
@@ -1154,11 +1662,7 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             Users typically don't need to call this method directly.
         """
         # Get the observable for this field
-        obs = None
-        for key, o in self._lists.items():
-            if key.attr == attr:
-                obs = o
-                break
+        obs = self._field_observable(self._lists, attr)
 
         if obs is None:
             return  # Field not found
@@ -1259,11 +1763,7 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             Users typically don't need to call this method directly.
         """
         # Get the observable for this field
-        obs = None
-        for key, o in self._dicts.items():
-            if key.attr == attr:
-                obs = o
-                break
+        obs = self._field_observable(self._dicts, attr)
 
         if obs is None:
             return  # Field not found
@@ -1450,37 +1950,39 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
         # Get the pending redo function
         redo_func = self._pending_undo_groups.get(attr)
 
+        # Find the observable for this field to set the undoing flag
+        obs = self._field_observable(self._scalars, attr)
+
         # Add to the redo stack if it exists
         if redo_func is not None:
-            self._redo_stacks[attr].append(redo_func)
-            self._pending_undo_groups[attr] = None
+            if obs is not None:
+                # The current errors belong to the value the redo restores
+                redo_errors = self._snapshot_field_errors(attr, obs.get())
+                pending_redo = redo_func
 
-        # Find the observable for this field to set the undoing flag
-        obs = None
-        for key, o in self._scalars.items():
-            if key.attr == attr:
-                obs = o
-                break
+                def cached_redo_func() -> None:
+                    self._restore_with_errors(attr, pending_redo, redo_errors)
+
+                redo_func = cached_redo_func
 
-        # Set the undoing flag if we found the observable and it's a UndoableObservable
-        from observant.undoable_observable import UndoableObservable
+            self._redo_stacks[attr].append(redo_func)
+            self._pending_undo_groups[attr] = None
 
-        if obs is not None and isinstance(obs, UndoableObservable):
+        # Set the undoing flag if we found the observable
+        if obs is not None:
             obs.set_undoing(True)
 
         try:
             undo_func()
         finally:
             # Reset the undoing flag
-            if obs is not None and isinstance(obs, UndoableObservable):
+            if obs is not None:
                 obs.set_undoing(False)
 
         # If sync is enabled for this field, update the model
-        for key in self._scalars:
-            if key.attr == attr and key.sync:
-                value = self._scalars[key].get()
-                setattr(self._obj, attr, value)
-                break
+        synced = self._scalars.get(ProxyFieldKey(attr, True))
+        if synced is not None:
+            setattr(self._obj, attr, synced.get())
 
     @override
     def redo(self, attr: str) -> None:
@@ -1522,40 +2024,26 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             undo_func = self._pending_undo_groups[attr]
 
         # Find the observable for this field to manually track changes
-        obs_list = None
-        obs_dict = None
-
-        # Check if this is a list field
-        for key, o in self._lists.items():
-            if key.attr == attr:
-                obs_list = o
-                break
-
-        # Check if this is a dict field
-        if obs_list is None:
-            for key, o in self._dicts.items():
-                if key.attr == attr:
-                    obs_dict = o
-                    break
+        # Check if this is a list field, then a dict field
+        obs_list = self._field_observable(self._lists, attr)
+        obs_dict = self._field_observable(self._dicts, attr) if obs_list is None else None
 
         # Find the scalar observable for this field to set the undoing flag
-        obs_scalar = None
-        for key, o in self._scalars.items():
-            if key.attr == attr:
-                obs_scalar = o
-                break
+        obs_scalar = self._field_observable(self._scalars, attr)
 
-        # Set the undoing flag if we found the observable and it's a UndoableObservable
-        from observant.undoable_observable import UndoableObservable
+        # The current value and errors are what an undo of this redo restores
+        undo_value = obs_scalar.get() if obs_scalar is not None else None
+        undo_errors = self._snapshot_field_errors(attr, undo_value)
 
-        if obs_scalar is not None and isinstance(obs_scalar, UndoableObservable):
+        # Set the undoing flag if we found the observable
+        if obs_scalar is not None:
             obs_scalar.set_undoing(True)
 
         try:
             redo_func()
         finally:
             # Reset the undoing flag
-            if obs_scalar is not None and isinstance(obs_scalar, UndoableObservable):
+            if obs_scalar is not None:
                 obs_scalar.set_undoing(False)
 
         # Add the undo function back to the undo stack
@@ -1567,15 +2055,13 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             # we need to create one based on the current state
 
             # For scalar fields
-            for key, o in self._scalars.items():
-                if key.attr == attr:
-                    current_value = o.get()
+            if obs_scalar is not None:
+                o = obs_scalar
 
-                    def new_undo_func() -> None:
-                        o.set(current_value, notify=False)
+                def new_undo_func() -> None:
+                    self._restore_with_errors(attr, lambda: o.set(undo_value, notify=False), undo_errors)
 
-                    self._undo_stacks.setdefault(attr, []).append(new_undo_func)
-                    break
+                self._undo_stacks.setdefault(attr, []).append(new_undo_func)
 
             # For list fields
             if obs_list is not None:
@@ -1598,11 +2084,9 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
                 self._undo_stacks.setdefault(attr, []).append(new_dict_undo_func)
 
         # If sync is enabled for this field, update the model
-        for key in self._scalars:
-            if key.attr == attr and key.sync:
-                value = self._scalars[key].get()
-                setattr(self._obj, attr, value)
-                break
+        synced = self._scalars.get(ProxyFieldKey(attr, True))
+        if synced is not None:
+            setattr(self._obj, attr, synced.get())
 
     @override
     def can_undo(self, attr: str) -> bool:
@@ -1709,18 +2193,17 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
             return
 
         # Get the observable for this field
-        obs = None
-        for key, o in self._scalars.items():
-            if key.attr == attr:
-                obs = o
-                break
+        obs = self._field_observable(self._scalars, attr)
 
         if obs is None:
             return  # Field not found
 
+        # The value has not changed yet, so the current errors belong to old_value
+        old_errors = self._snapshot_field_errors(attr, old_value)
+
         # Create undo/redo functions
         def undo_func() -> None:
-            obs.set(old_value)
+            self._restore_with_errors(attr, lambda: obs.set(old_value), old_errors)
 
             # If we're undoing to the original value, clear the dirty state
             if old_value == self._initial_values.get(attr):
@@ -1762,16 +2245,25 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
                 segments.append((part, False))
         return segments
 
-    def _get_value_at_path(self, segments: list[tuple[str, bool]]) -> Any:
+    def _get_value_at_path(self, segments: list[tuple[str, bool]], getter: Callable[[Any], Any] | None = None) -> Any:
         """
         Get the current value at a path, returning None if any optional segment is None.
 
         Args:
             segments: List of (segment_name, is_optional) tuples.
+            getter: Optional operator.attrgetter for the whole dotted path. When given, it is
+                    tried first; the segment-by-segment walk only runs if the path is broken.
 
         Returns:
             The value at the path, or None if path is broken.
         """
+        if getter is not None:
+            try:
+                return getter(self._obj)
+            except AttributeError:
+                # A segment is None or missing; the walk below resolves that to None
+                pass
+
         current_obj: Any = self._obj
         for part, is_optional in segments:
             if current_obj is None:
@@ -1877,8 +2369,11 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
         Returns:
             A _PathObservable that wraps the value and reacts to parent changes.
         """
+        # Reads the whole path in C when every segment is present
+        read_path = attrgetter(".".join(part for part, _ in segments))
+
         # Create the result observable with current value
-        initial_value = self._get_value_at_path(segments)
+        initial_value = self._get_value_at_path(segments, read_path)
         result_obs: Observable[Any] = Observable(initial_value)
 
         def setup_subscriptions() -> None:
@@ -1895,7 +2390,7 @@ class ObservableProxy(Generic[T], IObservableProxy[T]):
                 # Subscribe to changes at this level
                 def make_handler() -> Callable[[Any], None]:
                     def handler(_: Any) -> None:
-                        new_value = self._get_value_at_path(segments)
+                        new_value = self._get_value_at_path(segments, read_path)
                         if result_obs.get() != new_value:
                             result_obs.set(new_value)
 
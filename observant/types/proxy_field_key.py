@@ -1,10 +1,8 @@
-from dataclasses import dataclass
-from typing import TypeVar
+from typing import NamedTuple
 
-T = TypeVar("T")
 
+class ProxyFieldKey(NamedTuple):
+    """Key of a proxied field: the attribute name and whether it syncs to the model."""
 
-@dataclass(frozen=True)
-class ProxyFieldKey:
     attr: str
     sync: bool
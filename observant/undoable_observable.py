@@ -24,6 +24,8 @@ class UndoableObservable(Observable[T], Generic[T]):
         _is_undoing: Flag to prevent recursive tracking during undo/redo operations.
     """
 
+    __slots__ = ("_attr", "_proxy", "_is_undoing")
+
     def __init__(self, value: T, attr: str, proxy: IObservableProxy[TValue], *, on_change_enabled: bool = True) -> None:
         """
         Initialize an UndoableObservable with a value, attribute name, and proxy.
@@ -40,12 +42,14 @@ class UndoableObservable(Observable[T], Generic[T]):
         self._is_undoing = False  # Flag to prevent recursive tracking during undo/redo
 
     @override
-    def set(self, value: T, notify: bool = True) -> None:
+    def set(self, value: T, notify: bool = True, *, force: bool = False) -> None:
         """
         Set a new value and track the change for undo/redo if appropriate.
 
         This method extends the base Observable.set() method to track changes
-        for undo/redo functionality. Changes are only tracked if:
+        for undo/redo functionality. Setting a value equal to the current one is
+        a no-op: callbacks (sync, dirty tracking, validation) are not run.
+        Changes are only tracked if:
         - The new value is different from the old value
         - notify is True (changes with notify=False are not tracked)
         - _is_undoing is False (prevents recursive tracking during undo/redo)
@@ -53,11 +57,18 @@ class UndoableObservable(Observable[T], Generic[T]):
         Args:
             value: The new value to set.
             notify: Whether to notify callbacks and track for undo/redo.
+            force: If True, store the value and notify callbacks even if it is equal
+                   to the current value (e.g. after mutating it in place).
         """
         old_value = self.get()
 
+        if old_value is value or old_value == value:
+            if force:
+                super().set(value, notify=notify)
+            return
+
         # Only track changes if not already undoing and notify is True
-        if old_value != value and notify and not self._is_undoing:
+        if notify and not self._is_undoing:
             self._proxy.track_scalar_change(self._attr, old_value, value)
 
         super().set(value, notify=notify)
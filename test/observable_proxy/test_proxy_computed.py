@@ -5,13 +5,13 @@ from assertpy import assert_that
 from observant import ObservableProxy
 
 
-@dataclass
+@dataclass(slots=True)
 class Library:
     title: str
     books: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     username: str
     preferences: dict[str, str]
@@ -68,6 +68,30 @@ class TestObservableProxyComputed:
         proxy.observable(str, "username").set("Grace")
         assert_that(proxy.computed(str, "description").get()).is_equal_to("Grace is 37 years old")
 
+    def test_computed_property_get_uses_cached_value(self) -> None:
+        """Test that reading a computed property does not re-run its compute function."""
+        # Arrange
+        profile = UserProfile(username="Ada", preferences={}, age=36)
+        proxy = ObservableProxy(profile, sync=False)
+        calls: list[str] = []
+
+        def username_upper() -> str:
+            value = proxy.observable(str, "username").get().upper()
+            calls.append(value)
+            return value
+
+        proxy.register_computed("username_upper", username_upper, ["username"])
+        computed = proxy.computed(str, "username_upper")
+
+        # Act
+        values = [computed.get() for _ in range(3)]
+        proxy.observable(str, "username").set("Grace")
+        values += [computed.get() for _ in range(3)]
+
+        # Assert - computed once on registration and once per dependency change
+        assert_that(values).is_equal_to(["ADA"] * 3 + ["GRACE"] * 3)
+        assert_that(calls).is_equal_to(["ADA", "GRACE"])
+
     def test_computed_property_with_list_dependency(self) -> None:
         """Test that a computed property can depend on a list."""
         # Arrange
@@ -5,20 +5,20 @@ from assertpy import assert_that
 from observant import ObservableProxy
 
 
-@dataclass
+@dataclass(slots=True)
 class Zoo:
     name: str
     animals: list[str]
     metadata: dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Library:
     title: str
     books: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     username: str
     preferences: dict[str, str]
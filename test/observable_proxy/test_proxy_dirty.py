@@ -5,20 +5,20 @@ from assertpy import assert_that
 from observant import ObservableProxy
 
 
-@dataclass
+@dataclass(slots=True)
 class Zoo:
     name: str
     animals: list[str]
     metadata: dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Library:
     title: str
     books: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     username: str
     preferences: dict[str, str]
@@ -307,6 +307,24 @@ class TestObservableProxyDirtyObservable:
         # Assert - callback fired with False
         assert_that(callback_values).is_equal_to([True, False])
 
+    def test_is_dirty_observable_fires_only_on_transitions(self) -> None:
+        """Test that is_dirty notifies when the proxy becomes dirty or clean, not on every change."""
+        # Arrange
+        profile = UserProfile(username="start", preferences={}, age=40)
+        proxy = ObservableProxy(profile, sync=False)
+        callback_values: list[bool] = []
+        proxy.is_dirty().on_change(lambda v: callback_values.append(v))
+
+        # Act
+        proxy.observable(str, "username").set("first")
+        proxy.observable(str, "username").set("second")
+        proxy.observable(int, "age").set(41)
+        proxy.reset_dirty()
+        proxy.reset_dirty()
+
+        # Assert
+        assert_that(callback_values).is_equal_to([True, False])
+
     def test_is_dirty_observable_with_list_field(self) -> None:
         """Test that is_dirty() works with list field changes."""
         # Arrange
@@ -5,7 +5,7 @@ from assertpy import assert_that
 from observant import ObservableProxy
 
 
-@dataclass
+@dataclass(slots=True)
 class Library:
     title: str
     books: list[str]
@@ -46,6 +46,54 @@ class TestObservableProxyList:
         # Assert
         assert_that(lib.books).contains("Odyssey", "Iliad")
 
+    def test_list_sync_mutates_model_list_in_place(self) -> None:
+        """Test sync=True keeps the model's own list object rather than replacing it with copies."""
+        # Arrange
+        lib = Library(title="Classic", books=["Odyssey"])
+        original_books = lib.books
+        proxy = ObservableProxy(lib, sync=True)
+        books = proxy.observable_list(str, "books")
+
+        # Act
+        books.append("Iliad")
+        books.remove("Odyssey")
+
+        # Assert
+        assert_that(lib.books).is_same_as(original_books)
+        assert_that(original_books).is_equal_to(["Iliad"])
+
+    def test_save_to_own_model_skips_synced_list_copy(self) -> None:
+        """Test save_to() leaves a synced list as already written back, and copies it for other targets."""
+        # Arrange
+        lib = Library(title="Classic", books=["Odyssey"])
+        proxy = ObservableProxy(lib, sync=True)
+        proxy.observable_list(str, "books").append("Iliad")
+        synced_books = lib.books
+        other = Library(title="", books=[])
+
+        # Act
+        proxy.save_to(lib)
+        proxy.save_to(other)
+
+        # Assert
+        assert_that(lib.books).is_same_as(synced_books)
+        assert_that(other.books).is_equal_to(["Odyssey", "Iliad"])
+        assert_that(other.books).is_not_same_as(synced_books)
+
+    def test_save_to_writes_synced_list_back_after_model_attribute_replaced(self) -> None:
+        """Test save_to() writes a synced list back when the model's attribute was replaced externally."""
+        # Arrange
+        lib = Library(title="Classic", books=["Odyssey"])
+        proxy = ObservableProxy(lib, sync=True)
+        proxy.observable_list(str, "books").append("Iliad")
+        lib.books = []
+
+        # Act
+        proxy.save_to(lib)
+
+        # Assert
+        assert_that(lib.books).is_equal_to(["Odyssey", "Iliad"])
+
     def test_observable_list_does_not_mutate_model_when_sync_false(self) -> None:
         """ObservableList with sync=False should not affect the original model."""
         # Arrange
@@ -6,7 +6,7 @@ from assertpy import assert_that
 from observant import ObservableProxy
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     username: str
     preferences: dict[str, str]
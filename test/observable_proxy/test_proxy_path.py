@@ -6,20 +6,20 @@ import pytest
 from observant import ObservableProxy
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     city: str = ""
     country: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Habitat:
     name: str = ""
     climate: str = ""
     location: Location | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Animal:
     name: str
     species: str
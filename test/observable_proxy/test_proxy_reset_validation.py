@@ -5,7 +5,7 @@ from assertpy import assert_that
 from observant import ObservableProxy
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     username: str
     email: str
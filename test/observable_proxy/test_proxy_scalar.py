@@ -5,13 +5,27 @@ from assertpy import assert_that
 from observant import ObservableProxy
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     username: str
     preferences: dict[str, str]
     age: int
 
 
+
+class _UnhashableListener:
+    """Callable listener that defines __eq__ without __hash__, so it cannot be hashed."""
+
+    def __init__(self) -> None:
+        self.values: list[object] = []
+
+    def __call__(self, value: object) -> None:
+        self.values.append(value)
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+
 class TestObservableProxyScalar:
     """Unit tests for scalar operations in ObservableProxy class."""
 
@@ -40,6 +54,35 @@ class TestObservableProxyScalar:
         # Assert
         assert_that(profile.username).is_equal_to("updated")
 
+    def test_save_to_respects_property_setters(self) -> None:
+        """Test save_to goes through property setters on the target instead of writing __dict__ directly."""
+
+        # Arrange
+        class Account:
+            def __init__(self) -> None:
+                self.writes: list[str] = []
+                self._username = "original"
+
+            @property
+            def username(self) -> str:
+                return self._username
+
+            @username.setter
+            def username(self, value: str) -> None:
+                self.writes.append(value)
+                self._username = value
+
+        account = Account()
+        proxy = ObservableProxy(account, sync=False)
+        proxy.observable(str, "username").set("updated")
+
+        # Act
+        proxy.save_to(account)
+
+        # Assert
+        assert_that(account.writes).is_equal_to(["updated"])
+        assert_that(account.username).is_equal_to("updated")
+
     def test_update_sets_multiple_scalar_fields(self) -> None:
         """Test update() sets multiple scalar observables at once."""
         # Arrange
@@ -53,6 +96,63 @@ class TestObservableProxyScalar:
         assert_that(proxy.observable(str, "username").get()).is_equal_to("two")
         assert_that(proxy.observable(int, "age").get()).is_equal_to(10)
 
+    def test_update_notifies_after_all_fields_are_set(self) -> None:
+        """Test update() applies every field before any change callback runs."""
+        # Arrange
+        profile = UserProfile(username="one", preferences={}, age=5)
+        proxy = ObservableProxy(profile, sync=False)
+        proxy.register_computed("summary", lambda: f"{proxy.observable(str, 'username').get()} ({proxy.observable(int, 'age').get()})", ["username", "age"])
+        summaries: list[str] = []
+        proxy.computed(str, "summary").on_change(summaries.append)
+
+        # Act
+        proxy.update(username="two", age=10)
+
+        # Assert - no intermediate "two (5)"
+        assert_that(summaries).is_equal_to(["two (10)"])
+
+    def test_update_with_unhashable_listener_on_several_fields(self) -> None:
+        """Test update() still syncs and notifies when a listener on several fields is unhashable."""
+        # Arrange
+        profile = UserProfile(username="one", preferences={}, age=5)
+        proxy = ObservableProxy(profile, sync=True)
+        listener = _UnhashableListener()
+        proxy.observable(str, "username").on_change(listener)
+        proxy.observable(int, "age").on_change(listener)
+
+        # Act
+        proxy.update(username="two", age=10)
+
+        # Assert - called once, with the value of the last field set
+        assert_that(listener.values).is_equal_to([10])
+        assert_that(profile.username).is_equal_to("two")
+        assert_that(profile.age).is_equal_to(10)
+
+    def test_batch_defers_computed_and_validation_until_exit(self) -> None:
+        """Test proxy.batch() recomputes and validates once, after every change in the block."""
+        # Arrange
+        profile = UserProfile(username="one", preferences={}, age=5)
+        proxy = ObservableProxy(profile, sync=False)
+        proxy.register_computed("summary", lambda: f"{proxy.observable(str, 'username').get()} ({proxy.observable(int, 'age').get()})", ["username", "age"])
+        summaries: list[str] = []
+        proxy.computed(str, "summary").on_change(summaries.append)
+        validated: list[str] = []
+        proxy.add_validator("username", lambda v: validated.append(v))
+
+        # Act
+        with proxy.batch():
+            proxy.observable(str, "username").set("two")
+            proxy.observable(str, "username").set("three")
+            proxy.observable(int, "age").set(10)
+
+            # Assert - nothing has run yet
+            assert_that(summaries).is_empty()
+
+        # Assert
+        assert_that(summaries).is_equal_to(["three (10)"])
+        assert_that(validated[-1:]).is_equal_to(["three"])
+        assert_that(validated).does_not_contain("two")
+
     def test_load_dict_sets_scalar_values(self) -> None:
         """Test load_dict() applies multiple scalar fields via a dictionary."""
         # Arrange
@@ -65,3 +165,55 @@ class TestObservableProxyScalar:
         # Assert
         assert_that(proxy.observable(str, "username").get()).is_equal_to("new")
         assert_that(proxy.observable(int, "age").get()).is_equal_to(99)
+
+    def test_load_dict_notifies_after_all_fields_are_set(self) -> None:
+        """Test load_dict() applies every field before any change callback runs."""
+        # Arrange
+        profile = UserProfile(username="one", preferences={}, age=5)
+        proxy = ObservableProxy(profile, sync=False)
+        proxy.register_computed("summary", lambda: f"{proxy.observable(str, 'username').get()} ({proxy.observable(int, 'age').get()})", ["username", "age"])
+        summaries: list[str] = []
+        proxy.computed(str, "summary").on_change(summaries.append)
+
+        # Act
+        proxy.load_dict({"username": "two", "age": 10})
+
+        # Assert
+        assert_that(summaries).is_equal_to(["two (10)"])
+
+    def test_setting_equal_value_is_a_no_op(self) -> None:
+        """Test setting a scalar to its current value skips callbacks, dirty tracking and validation."""
+        # Arrange
+        profile = UserProfile(username="same", preferences={}, age=30)
+        proxy = ObservableProxy(profile, sync=False)
+        validated: list[str] = []
+        proxy.add_validator("username", lambda v: validated.append(v))
+        username = proxy.observable(str, "username")
+        changes: list[str] = []
+        username.on_change(changes.append)
+        validated.clear()
+
+        # Act
+        username.set("same")
+
+        # Assert
+        assert_that(changes).is_empty()
+        assert_that(validated).is_empty()
+        assert_that(proxy.is_dirty()).is_false()
+
+    def test_force_set_notifies_for_equal_value(self) -> None:
+        """Test set(..., force=True) notifies callbacks even when the value is unchanged."""
+        # Arrange
+        profile = UserProfile(username="same", preferences={}, age=30)
+        proxy = ObservableProxy(profile, sync=False)
+        username = proxy.observable(str, "username")
+        changes: list[str] = []
+        username.on_change(changes.append)
+
+        # Act
+        username.set("same", force=True)
+
+        # Assert
+        assert_that(changes).is_equal_to(["same"])
+        assert_that(proxy.is_dirty()).is_true()
+        assert_that(proxy.can_undo("username")).is_false()
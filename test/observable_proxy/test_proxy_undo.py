@@ -6,14 +6,14 @@ from assertpy import assert_that
 from observant import ObservableProxy
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     username: str
     preferences: dict[str, str]
     age: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Library:
     title: str
     books: list[str]
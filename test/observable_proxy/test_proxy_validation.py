@@ -1,24 +1,32 @@
 from dataclasses import dataclass
 from typing import Any
 
+import pytest
 from assertpy import assert_that
 
 from observant import ObservableProxy
 
 
-@dataclass
+@dataclass(slots=True)
 class Library:
     title: str
     books: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     username: str
     preferences: dict[str, str]
     age: int
 
 
+@dataclass(slots=True)
+class Credentials:
+    password: str
+    confirm: str
+
+
+@pytest.mark.validation
 class TestObservableProxyValidation:
     """Unit tests for validation in ObservableProxy class."""
 
@@ -110,6 +118,47 @@ class TestObservableProxyValidation:
         assert_that(proxy.is_valid()).is_true()
         assert_that(proxy.validation_for("books").get()).is_empty()
 
+    def test_keyed_validator_reruns_only_when_key_changes(self) -> None:
+        """Test that a validator added with key= is skipped while the key stays the same."""
+        # Arrange
+        library = Library(title="Test", books=["Book1"])
+        proxy = ObservableProxy(library, sync=False)
+        calls: list[int] = []
+
+        def validator(v: list[str]) -> str | None:
+            calls.append(len(v))
+            return "Need at least 2 books" if len(v) < 2 else None
+
+        proxy.add_validator("books", validator, key=len)
+        books = proxy.observable_list(str, "books")
+
+        # Act - same length, then a new length
+        books[0] = "Book1 (2nd edition)"
+        books.append("Book2")
+
+        # Assert
+        assert_that(calls).is_equal_to([1, 2])
+        assert_that(proxy.is_valid()).is_true()
+
+    def test_keyed_validator_repeats_cached_exception(self) -> None:
+        """Test that a keyed validator keeps reporting its error while the key is unchanged."""
+        # Arrange
+        library = Library(title="Test", books=[])
+        proxy = ObservableProxy(library, sync=False)
+
+        def validator(v: list[str]) -> str | None:
+            raise ValueError("Bad books")
+
+        proxy.add_validator("books", validator, key=len)
+        books = proxy.observable_list(str, "books")
+        books.append("Book1")
+
+        # Act - same length
+        books[0] = "Book2"
+
+        # Assert
+        assert_that(proxy.validation_for("books").get()).is_equal_to(["Validation error: Bad books"])
+
     def test_dict_field_validation(self) -> None:
         """Test validation for dict fields."""
         # Arrange
@@ -157,6 +206,44 @@ class TestObservableProxyValidation:
         assert_that(errors).contains_key("age")
         assert_that(errors["age"]).contains("Too young")
 
+    def test_unchanged_errors_do_not_notify(self) -> None:
+        """Test that re-validating to the same errors leaves validation_errors() untouched."""
+        # Arrange
+        profile = UserProfile(username="valid", preferences={}, age=30)
+        proxy = ObservableProxy(profile, sync=False)
+        proxy.add_validator("username", lambda v: "Username too short" if len(v) < 5 else None)
+        username = proxy.observable(str, "username")
+        username.set("abc")
+        errors_before = proxy.validation_errors()["username"]
+        changes: list[object] = []
+        proxy.validation_errors().on_change(changes.append)
+
+        # Act - another invalid value with the same error
+        username.set("ab")
+
+        # Assert
+        assert_that(changes).is_empty()
+        assert_that(proxy.validation_errors()["username"]).is_same_as(errors_before)
+
+    def test_is_valid_notifies_only_when_validity_flips(self) -> None:
+        """Test that is_valid() only notifies when the proxy switches between valid and invalid."""
+        # Arrange
+        profile = UserProfile(username="valid", preferences={}, age=30)
+        proxy = ObservableProxy(profile, sync=False)
+        proxy.add_validator("username", lambda v: "Username too short" if len(v) < 5 else None)
+        username = proxy.observable(str, "username")
+        validity: list[bool] = []
+        proxy.is_valid().on_change(validity.append)
+
+        # Act
+        username.set("valid_name")
+        username.set("abc")
+        username.set("ab")
+        username.set("valid")
+
+        # Assert
+        assert_that(validity).is_equal_to([False, True])
+
     def test_exception_in_validator(self) -> None:
         """Test that exceptions in validators are caught and reported as errors."""
         # Arrange
@@ -248,6 +335,7 @@ class TestObservableProxyValidation:
         assert_that(proxy.is_valid()).is_true()
         assert_that(proxy.validation_for("username").get()).is_empty()
 
+    @pytest.mark.undo_redo
     def test_validation_state_after_undo_redo(self) -> None:
         """Test that validation state is updated correctly after undo/redo operations."""
         # Arrange
@@ -290,6 +378,95 @@ class TestObservableProxyValidation:
         # And the actual value is restored
         assert_that(proxy.observable(str, "username").get()).is_equal_to("abc")
 
+    @pytest.mark.undo_redo
+    def test_undo_redo_restores_errors_without_rerunning_validators(self) -> None:
+        """Test that undo/redo restore errors of cached validators instead of re-running them."""
+        # Arrange
+        profile = UserProfile(username="valid_name", preferences={}, age=30)
+        proxy = ObservableProxy(profile, sync=False)
+        calls: list[str] = []
+
+        def validator(v: str) -> str | None:
+            calls.append(v)
+            return "Username too short" if len(v) < 5 else None
+
+        proxy.add_validator("username", validator, cache=True)
+        proxy.set_undo_config("username", enabled=True)
+        proxy.observable(str, "username").set("abc")
+        calls.clear()
+
+        # Act - undo, redo, then undo again
+        proxy.undo("username")
+        assert_that(proxy.is_valid()).is_true()
+        proxy.redo("username")
+        assert_that(proxy.validation_for("username").get()).contains("Username too short")
+        proxy.undo("username")
+
+        # Assert - validation state follows the value, but no validator ran
+        assert_that(proxy.observable(str, "username").get()).is_equal_to("valid_name")
+        assert_that(proxy.is_valid()).is_true()
+        assert_that(proxy.validation_for("username").get()).is_empty()
+        assert_that(calls).is_empty()
+
+    @pytest.mark.undo_redo
+    def test_undo_after_batch_revalidates_restored_value(self) -> None:
+        """Test that undoing a change made inside a batch re-runs validators for the restored value."""
+        # Arrange
+        profile = UserProfile(username="valid_name", preferences={}, age=30)
+        proxy = ObservableProxy(profile, sync=False)
+        proxy.add_validator("username", lambda v: "Username too short" if len(v) < 5 else None, cache=True)
+        proxy.set_undo_config("username", enabled=True)
+        username = proxy.observable(str, "username")
+
+        # Act - the errors for "abc" were never computed when "valid_again" was set
+        with proxy.batch():
+            username.set("abc")
+            username.set("valid_again")
+        proxy.undo("username")
+
+        # Assert
+        assert_that(username.get()).is_equal_to("abc")
+        assert_that(proxy.validation_for("username").get()).is_equal_to(["Username too short"])
+        assert_that(proxy.is_valid().get()).is_false()
+
+    @pytest.mark.undo_redo
+    def test_undo_revalidates_value_set_without_notify(self) -> None:
+        """Test that undoing to a value set with notify=False re-runs validators instead of restoring stale errors."""
+        # Arrange
+        profile = UserProfile(username="valid_name", preferences={}, age=30)
+        proxy = ObservableProxy(profile, sync=False)
+        proxy.add_validator("username", lambda v: "Username too short" if len(v) < 5 else None, cache=True)
+        proxy.set_undo_config("username", enabled=True)
+        username = proxy.observable(str, "username")
+
+        # Act - "ab" is never validated, so the stored errors still belong to "valid_name"
+        username.set("ab", notify=False)
+        username.set("valid_again")
+        proxy.undo("username")
+
+        # Assert
+        assert_that(username.get()).is_equal_to("ab")
+        assert_that(proxy.validation_for("username").get()).is_equal_to(["Username too short"])
+        assert_that(proxy.is_valid().get()).is_false()
+
+    @pytest.mark.undo_redo
+    def test_undo_revalidates_when_validators_change(self) -> None:
+        """Test that undo re-runs validators when they changed after the edit was made."""
+        # Arrange
+        profile = UserProfile(username="valid_name", preferences={}, age=30)
+        proxy = ObservableProxy(profile, sync=False)
+        proxy.set_undo_config("username", enabled=True)
+        proxy.observable(str, "username").set("abc")
+
+        # Act - add a validator the restored value fails, then undo
+        proxy.add_validator("username", lambda v: "No underscores" if "_" in v else None)
+        proxy.undo("username")
+
+        # Assert - errors come from the current validators, not the cached state
+        assert_that(proxy.is_valid()).is_false()
+        assert_that(proxy.validation_for("username").get()).contains("No underscores")
+
+    @pytest.mark.computed
     def test_computed_field_validation(self) -> None:
         """Test that computed fields can be validated."""
         # Arrange
@@ -320,6 +497,35 @@ class TestObservableProxyValidation:
         assert_that(proxy.validation_errors()).contains_key("full_name")
         assert_that(proxy.validation_for("full_name").get()).contains("Full name too short")
 
+    @pytest.mark.computed
+    def test_computed_field_validated_when_validator_added(self) -> None:
+        """Test that adding a validator to a computed field validates its current value once per change."""
+        # Arrange
+        profile = UserProfile(username="bob", preferences={}, age=30)
+        proxy = ObservableProxy(profile, sync=False)
+        computes: list[str] = []
+
+        def full_name() -> str:
+            name = f"{proxy.observable(str, 'username').get()} Smith"
+            computes.append(name)
+            return name
+
+        proxy.register_computed("full_name", full_name, ["username"])
+
+        # Act - add a validator the current computed value fails
+        proxy.add_validator("full_name", lambda v: "Full name too short" if len(v) < 10 else None)
+
+        # Assert - validated immediately
+        assert_that(proxy.validation_for("full_name").get()).contains("Full name too short")
+
+        # Act - a dependency change computes the value once and validates that value
+        computes.clear()
+        proxy.observable(str, "username").set("robert")
+
+        # Assert
+        assert_that(computes).is_equal_to(["robert Smith"])
+        assert_that(proxy.is_valid()).is_true()
+
     def test_load_dict_triggers_validation(self) -> None:
         """Test that load_dict() triggers validation for the fields it sets."""
         # Arrange
@@ -336,17 +542,65 @@ class TestObservableProxyValidation:
         proxy.load_dict({"username": "abc"})
 
         # Assert - validation triggered
-        assert_that(proxy.is_valid()).is_false()
-        assert_that(proxy.validation_errors()).contains_key("username")
-        assert_that(proxy.validation_for("username").get()).contains("Username too short")
+        valid, errors, errors_by_field = proxy.validation_snapshot()
+        assert_that(valid).is_false()
+        assert_that(errors).contains_key("username")
+        assert_that(errors_by_field["username"]).contains("Username too short")
 
         # Act - load dict with valid value
         proxy.load_dict({"username": "valid_name"})
 
         # Assert - validation passes
-        assert_that(proxy.is_valid()).is_true()
-        assert_that(proxy.validation_errors()).does_not_contain_key("username")
-        assert_that(proxy.validation_for("username").get()).is_empty()
+        valid, errors, errors_by_field = proxy.validation_snapshot()
+        assert_that(valid).is_true()
+        assert_that(errors).does_not_contain_key("username")
+        assert_that(errors_by_field).is_empty()
+
+    def test_load_dict_validates_once_per_field(self) -> None:
+        """Test that load_dict() validates each field once and updates is_valid once."""
+        # Arrange
+        profile = UserProfile(username="valid", preferences={}, age=30)
+        proxy = ObservableProxy(profile, sync=False)
+        proxy.add_validator("username", lambda v: "Username too short" if len(v) < 5 else None)
+        proxy.add_validator("age", lambda v: "Too young" if v < 18 else None)
+        proxy.register_computed("summary", lambda: f"{proxy.observable(str, 'username').get()} ({proxy.observable(int, 'age').get()})", ["username", "age"])
+        summaries: list[str] = []
+        proxy.add_validator("summary", lambda v: summaries.append(v))
+        summaries.clear()
+        validity: list[bool] = []
+        proxy.is_valid().on_change(validity.append)
+
+        # Act
+        proxy.load_dict({"username": "abc", "age": 10})
+
+        # Assert
+        assert_that(validity).is_equal_to([False])
+        assert_that(summaries).is_equal_to(["abc (10)"])
+        assert_that(proxy.validation_for("username").get()).is_equal_to(["Username too short"])
+        assert_that(proxy.validation_for("age").get()).is_equal_to(["Too young"])
+
+    def test_validation_snapshot_matches_observables(self) -> None:
+        """Test that validation_snapshot() agrees with is_valid(), validation_errors() and validation_for()."""
+        # Arrange
+        profile = UserProfile(username="a", preferences={}, age=10)
+        proxy = ObservableProxy(profile, sync=False)
+        proxy.add_validator("username", lambda v: "Too short" if len(v) < 3 else None)
+        proxy.add_validator("age", lambda v: "Too young" if v < 18 else None)
+
+        # Act
+        valid, errors, errors_by_field = proxy.validation_snapshot()
+
+        # Assert
+        assert_that(valid).is_equal_to(proxy.is_valid().get())
+        assert_that(errors).is_equal_to(proxy.validation_errors().copy())
+        assert_that(errors_by_field["username"]).is_equal_to(proxy.validation_for("username").get())
+        assert_that(errors_by_field["age"]).is_equal_to(proxy.validation_for("age").get())
+
+        # Act - mutating the snapshot does not affect the proxy
+        errors_by_field["age"].append("Extra")
+
+        # Assert
+        assert_that(proxy.validation_for("age").get()).is_equal_to(["Too young"])
 
     def test_validator_returns_string_representation(self) -> None:
         """Test that validators return string representations of different data types."""
@@ -380,3 +634,92 @@ class TestObservableProxyValidation:
         pref_errors = proxy.validation_for("preferences").get()
         assert_that(pref_errors).is_length(1)
         assert_that(pref_errors[0]).is_equal_to("Invalid preferences: {'error': 'Invalid'}")
+
+    def test_validator_results_cached_for_repeated_values(self) -> None:
+        """Test that cache=True validators are not re-run for a scalar value they already validated."""
+        # Arrange
+        profile = UserProfile(username="valid_name", preferences={}, age=30)
+        proxy = ObservableProxy(profile, sync=False)
+        calls: list[str] = []
+
+        def validator(v: str) -> str | None:
+            calls.append(v)
+            return "Username too short" if len(v) < 5 else None
+
+        proxy.add_validator("username", validator, cache=True)
+        username = proxy.observable(str, "username")
+
+        # Act - alternate between two values
+        username.set("abc")
+        username.set("valid_name")
+        username.set("abc")
+
+        # Assert - each distinct value was validated once, errors still follow the value
+        assert_that(calls).is_equal_to(["valid_name", "abc"])
+        assert_that(proxy.validation_for("username").get()).is_equal_to(["Username too short"])
+
+        # Act - adding a validator discards the cached results
+        proxy.add_validator("username", lambda v: "No digits" if any(c.isdigit() for c in v) else None, cache=True)
+        username.set("valid_name")
+
+        # Assert - the current value was re-validated, then the new one
+        assert_that(calls).is_equal_to(["valid_name", "abc", "abc", "valid_name"])
+
+    def test_validators_reading_other_fields_are_not_cached(self) -> None:
+        """Test that validators without cache=True are re-run for values they already validated."""
+        # Arrange
+        proxy = ObservableProxy(Credentials(password="secret", confirm="secret"), sync=False)
+        password = proxy.observable(str, "password")
+        confirm = proxy.observable(str, "confirm")
+        proxy.add_validator("confirm", lambda v: None if v == password.get() else "Passwords do not match")
+
+        # Act - change the password, then retype the old confirmation
+        password.set("other")
+        confirm.set("x")
+        confirm.set("secret")
+
+        # Assert
+        assert_that(proxy.validation_for("confirm").get()).is_equal_to(["Passwords do not match"])
+        assert_that(proxy.is_valid().get()).is_false()
+
+    def test_cached_error_messages_are_shared(self) -> None:
+        """Test that equal error messages built for different values end up as one string object."""
+        # Arrange
+        profile = UserProfile(username="user", preferences={}, age=30)
+        proxy = ObservableProxy(profile, sync=False)
+        # join() builds a new string object on every call
+        proxy.add_validator("age", lambda v: "".join(["Age must ", "be positive"]) if v < 0 else None, cache=True)
+        age = proxy.observable(int, "age")
+
+        # Act
+        age.set(-1)
+        first = proxy.validation_for("age").get()[0]
+        age.set(5)
+        age.set(-2)
+        second = proxy.validation_for("age").get()[0]
+
+        # Assert
+        assert_that(second).is_equal_to("Age must be positive")
+        assert_that(second).is_same_as(first)
+
+    def test_validator_results_not_cached_for_mutable_values(self) -> None:
+        """Test that mutable values are re-validated every time, even for a cache=True validator."""
+        # Arrange
+        profile = UserProfile(username="user", preferences={}, age=30)
+        proxy = ObservableProxy(profile, sync=False)
+        calls: list[dict[str, str]] = []
+
+        def validator(v: dict[str, str]) -> str | None:
+            calls.append(dict(v))
+            return "Preferences required" if not v else None
+
+        proxy.add_validator("preferences", validator, cache=True)
+        prefs = proxy.observable_dict((str, str), "preferences")
+
+        # Act
+        prefs["theme"] = "dark"
+        del prefs["theme"]
+
+        # Assert
+        assert_that(calls).is_equal_to([{}, {"theme": "dark"}, {}])
+        assert_that(proxy.validation_for("preferences").get()).is_equal_to(["Preferences required"])
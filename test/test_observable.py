@@ -1,6 +1,13 @@
+import asyncio
+import gc
+import threading
+import warnings
+import weakref
+
+import pytest
 from assertpy import assert_that
 
-from observant import Observable
+from observant import Observable, batch
 
 
 class TestObservable:
@@ -123,6 +130,321 @@ class TestObservable:
         assert_that(callback_values).is_length(1)
         assert_that(callback_values[0]).is_equal_to(100)
 
+    def test_weak_callback_does_not_keep_instance_alive(self) -> None:
+        """Test that a bound method registered with weak=True is dropped once its instance is collected."""
+
+        # Arrange
+        class Listener:
+            def __init__(self) -> None:
+                self.values: list[int] = []
+
+            def record(self, value: int) -> None:
+                self.values.append(value)
+
+        observable = Observable[int](0)
+        listener = Listener()
+        observable.on_change(listener.record, weak=True)
+        observable.on_change(listener.record, weak=True)
+        observable.set(1)
+        listener_ref = weakref.ref(listener)
+
+        # Act
+        del listener
+        gc.collect()
+        observable.set(2)
+
+        # Assert
+        assert_that(listener_ref()).is_none()
+        assert_that(observable._callbacks).is_empty()  # pyright: ignore[reportPrivateUsage]
+
+    def test_weak_callback_is_called_while_alive(self) -> None:
+        """Test that a weak callback is called once per change while its target is alive."""
+        # Arrange
+        observable = Observable[int](0)
+        callback_values: list[int] = []
+
+        def record(value: int) -> None:
+            callback_values.append(value)
+
+        observable.on_change(record, weak=True)
+        observable.on_change(record, weak=True)
+
+        # Act
+        observable.set(1)
+
+        # Assert
+        assert_that(callback_values).is_equal_to([1])
+
+    def test_callback_registered_weakly_and_strongly_is_added_once(self) -> None:
+        """Test that registering one callback weakly and strongly, in either order, calls it once per change."""
+        # Arrange
+        observable = Observable[int](0)
+        callback_values: list[int] = []
+
+        def record(value: int) -> None:
+            callback_values.append(value)
+
+        def record_other(value: int) -> None:
+            callback_values.append(-value)
+
+        observable.on_change(record, weak=True)
+        observable.on_change(record)
+        observable.on_change(record_other)
+        observable.on_change(record_other, weak=True)
+
+        # Act
+        observable.set(1)
+
+        # Assert
+        assert_that(callback_values).is_equal_to([1, -1])
+
+    def test_batch_deduplicates_weak_callbacks(self) -> None:
+        """Test that a weak callback registered on several observables is called once per batch."""
+        # Arrange
+        a = Observable[int](0)
+        b = Observable[int](0)
+        callback_values: list[int] = []
+
+        def record(value: int) -> None:
+            callback_values.append(value)
+
+        a.on_change(record, weak=True)
+        b.on_change(record, weak=True)
+
+        # Act
+        with batch():
+            a.set(1)
+            b.set(2)
+
+        # Assert
+        assert_that(callback_values).is_equal_to([2])
+
+    def test_batch_notifies_once_with_final_value(self) -> None:
+        """Test that sets inside batch() notify each observable once, after the block."""
+        # Arrange
+        first = Observable[int](0)
+        second = Observable[str]("a")
+        notifications: list[object] = []
+        first.on_change(lambda value: notifications.append(value))
+        second.on_change(lambda value: notifications.append(value))
+
+        # Act
+        with batch():
+            first.set(1)
+            second.set("b")
+            with batch():
+                first.set(2)
+            first.set(3)
+
+            # Assert - values update immediately, callbacks wait
+            assert_that(first.get()).is_equal_to(3)
+            assert_that(notifications).is_empty()
+
+        # Assert
+        assert_that(notifications).is_equal_to([3, "b"])
+
+    def test_batch_calls_shared_callback_once(self) -> None:
+        """Test that a callback on several observables is called once per batch, with the last value."""
+        # Arrange
+        first = Observable[int](0)
+        second = Observable[int](0)
+        callback_values: list[int] = []
+
+        def refresh(value: int) -> None:
+            callback_values.append(value)
+
+        first.on_change(refresh)
+        second.on_change(refresh)
+
+        # Act
+        with batch():
+            first.set(1)
+            second.set(2)
+
+        # Assert
+        assert_that(callback_values).is_equal_to([2])
+
+    def test_batch_delivers_remaining_notifications_when_a_callback_raises(self) -> None:
+        """Test that one raising callback does not drop the other notifications of a batch."""
+        # Arrange
+        a = Observable[int](0)
+        b = Observable[int](0)
+        received: list[int] = []
+
+        def fail(_: int) -> None:
+            raise RuntimeError("boom")
+
+        a.on_change(fail)
+        b.on_change(received.append)
+
+        # Act
+        with pytest.raises(RuntimeError, match="boom"):
+            with batch():
+                a.set(1)
+                b.set(2)
+
+        # Assert
+        assert_that(received).is_equal_to([2])
+
+    def test_batch_accepts_unhashable_callbacks(self) -> None:
+        """Test that a batch notifies callbacks that cannot be hashed, deduplicating them by identity."""
+        # Arrange
+        a = Observable[int](0)
+        b = Observable[int](0)
+        received: list[int] = []
+
+        class Listener:
+            def __call__(self, value: int) -> None:
+                received.append(value)
+
+            def __eq__(self, other: object) -> bool:
+                return self is other
+
+        listener = Listener()
+        a.on_change(listener)
+        b.on_change(listener)
+
+        # Act
+        with batch():
+            a.set(1)
+            b.set(2)
+
+        # Assert
+        assert_that(received).is_equal_to([2])
+
+    def test_batch_does_not_capture_tasks_that_outlive_it(self) -> None:
+        """Test that a task created inside a batch() notifies immediately once the batch has closed."""
+        # Arrange
+        observable = Observable[int](0)
+        seen: list[int] = []
+        observable.on_change(seen.append)
+
+        async def later() -> None:
+            await asyncio.sleep(0)
+            observable.set(42)
+
+        async def run() -> None:
+            with batch():
+                task = asyncio.create_task(later())
+            await task
+
+        # Act
+        asyncio.run(run())
+
+        # Assert
+        assert_that(seen).is_equal_to([42])
+
+    def test_batch_does_not_capture_other_threads(self) -> None:
+        """Test that a batch() open on one thread does not defer sets made on another thread."""
+        # Arrange
+        observable = Observable[int](0)
+        callback_threads: list[str] = []
+        observable.on_change(lambda _: callback_threads.append(threading.current_thread().name))
+        worker = threading.Thread(target=lambda: observable.set(1), name="worker")
+
+        # Act
+        with batch():
+            worker.start()
+            worker.join()
+
+            # Assert - delivered immediately, on the setting thread
+            assert_that(callback_threads).is_equal_to(["worker"])
+
+        # Assert - nothing left over for the batch to flush
+        assert_that(callback_threads).is_equal_to(["worker"])
+
+    def test_batch_skips_notify_false(self) -> None:
+        """Test that batch() does not notify for sets made with notify=False."""
+        # Arrange
+        observable = Observable[int](0)
+        callback_values: list[int] = []
+        observable.on_change(lambda value: callback_values.append(value))
+
+        # Act
+        with batch():
+            observable.set(1, notify=False)
+
+        # Assert
+        assert_that(callback_values).is_empty()
+        assert_that(observable.get()).is_equal_to(1)
+
+    def test_set_async_awaits_async_callbacks(self) -> None:
+        """Test that set_async() runs sync callbacks and waits for async callbacks."""
+        # Arrange
+        observable = Observable[int](0)
+        events: list[str] = []
+
+        async def slow_callback(value: int) -> None:
+            await asyncio.sleep(0)
+            events.append(f"async {value}")
+
+        observable.on_change(lambda value: events.append(f"sync {value}"))
+        observable.on_change_async(slow_callback)
+
+        # Act
+        asyncio.run(observable.set_async(1))
+
+        # Assert
+        assert_that(events).is_equal_to(["sync 1", "async 1"])
+
+    def test_set_schedules_async_callbacks_on_running_loop(self) -> None:
+        """Test that set() schedules async callbacks without waiting for them."""
+        # Arrange
+        observable = Observable[int](0)
+        values: list[int] = []
+
+        async def callback(value: int) -> None:
+            values.append(value)
+
+        observable.on_change_async(callback)
+
+        async def run() -> list[int]:
+            observable.set(1)
+            before = list(values)
+            await asyncio.sleep(0)
+            return before
+
+        # Act
+        before = asyncio.run(run())
+
+        # Assert
+        assert_that(before).is_empty()
+        assert_that(values).is_equal_to([1])
+
+    def test_set_without_loop_warns_for_async_callbacks(self) -> None:
+        """Test that set() outside an event loop skips async callbacks with a warning."""
+        # Arrange
+        observable = Observable[int](0)
+
+        async def callback(value: int) -> None:
+            pass
+
+        observable.on_change_async(callback)
+
+        # Act & Assert
+        with pytest.warns(RuntimeWarning):
+            observable.set(1)
+        assert_that(observable.get()).is_equal_to(1)
+
+    def test_set_without_loop_warns_only_once(self) -> None:
+        """Test that the missing event loop warning is emitted once per observable, not on every set()."""
+        # Arrange
+        observable = Observable[int](0)
+
+        async def callback(value: int) -> None:
+            pass
+
+        observable.on_change_async(callback)
+
+        # Act
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            observable.set(1)
+            observable.set(2)
+
+        # Assert
+        assert_that([w.category for w in caught]).is_equal_to([RuntimeWarning])
+
     def test_bool_conversion(self) -> None:
         """Test boolean conversion of Observable."""
         # Arrange & Act